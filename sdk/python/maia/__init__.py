@@ -1,27 +1,8 @@
 """MAIA SDK - Python client for the MAIA memory system."""
 
-from maia.client import MAIAClient, AsyncMAIAClient
-from maia.types import (
-    Memory,
-    MemoryType,
-    MemorySource,
-    Namespace,
-    NamespaceConfig,
-    CreateMemoryInput,
-    UpdateMemoryInput,
-    SearchMemoriesInput,
-    SearchResult,
-    CreateNamespaceInput,
-    UpdateNamespaceInput,
-    ListOptions,
-    ListResponse,
-    GetContextInput,
-    ContextResponse,
-    ContextMemory,
-    ContextZoneStats,
-    Stats,
-    HealthResponse,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from maia.errors import (
     MAIAError,
     APIError,
@@ -31,16 +12,102 @@ from maia.errors import (
     AlreadyExistsError,
 )
 
+if TYPE_CHECKING:
+    from maia.client import (
+        MAIAClient,
+        AsyncMAIAClient,
+        get_default_async_client,
+    )
+    from maia.types import (
+        Memory,
+        MemoryType,
+        MemorySource,
+        Embedding,
+        EmbeddingEncoding,
+        Namespace,
+        NamespaceConfig,
+        CreateMemoryInput,
+        UpdateMemoryInput,
+        SearchMemoriesInput,
+        SearchResult,
+        CreateNamespaceInput,
+        UpdateNamespaceInput,
+        ListOptions,
+        ListResponse,
+        MemoryListResponse,
+        SearchListResponse,
+        NamespaceListResponse,
+        GetContextInput,
+        ContextResponse,
+        ContextMemory,
+        ContextZoneStats,
+        Stats,
+        HealthResponse,
+        BatchCall,
+    )
+
+# The clients and models are imported on first use, so code that only needs
+# ``maia.errors`` (or another light submodule) doesn't load httpx and pydantic.
+_LAZY_MODULES = {
+    "MAIAClient": "maia.client",
+    "AsyncMAIAClient": "maia.client",
+    "get_default_async_client": "maia.client",
+    "Memory": "maia.types",
+    "MemoryType": "maia.types",
+    "MemorySource": "maia.types",
+    "Embedding": "maia.types",
+    "EmbeddingEncoding": "maia.types",
+    "Namespace": "maia.types",
+    "NamespaceConfig": "maia.types",
+    "CreateMemoryInput": "maia.types",
+    "UpdateMemoryInput": "maia.types",
+    "SearchMemoriesInput": "maia.types",
+    "SearchResult": "maia.types",
+    "CreateNamespaceInput": "maia.types",
+    "UpdateNamespaceInput": "maia.types",
+    "ListOptions": "maia.types",
+    "ListResponse": "maia.types",
+    "MemoryListResponse": "maia.types",
+    "SearchListResponse": "maia.types",
+    "NamespaceListResponse": "maia.types",
+    "GetContextInput": "maia.types",
+    "ContextResponse": "maia.types",
+    "ContextMemory": "maia.types",
+    "ContextZoneStats": "maia.types",
+    "Stats": "maia.types",
+    "HealthResponse": "maia.types",
+    "BatchCall": "maia.types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a client or model the first time it is accessed."""
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names along with the loaded ones."""
+    return sorted([*globals(), *_LAZY_MODULES])
+
+
 __version__ = "0.1.0"
 
 __all__ = [
     # Client
     "MAIAClient",
     "AsyncMAIAClient",
+    "get_default_async_client",
     # Types
     "Memory",
     "MemoryType",
     "MemorySource",
+    "Embedding",
+    "EmbeddingEncoding",
     "Namespace",
     "NamespaceConfig",
     "CreateMemoryInput",
@@ -51,12 +118,16 @@ __all__ = [
     "UpdateNamespaceInput",
     "ListOptions",
     "ListResponse",
+    "MemoryListResponse",
+    "SearchListResponse",
+    "NamespaceListResponse",
     "GetContextInput",
     "ContextResponse",
     "ContextMemory",
     "ContextZoneStats",
     "Stats",
     "HealthResponse",
+    "BatchCall",
     # Errors
     "MAIAError",
     "APIError",
@@ -0,0 +1,72 @@
+"""Response cache for the MAIA SDK clients."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+
+class ResponseCache:
+    """A thread-safe LRU cache of response bodies with a fixed TTL.
+
+    Entries are keyed by request path and query parameters and hold the raw
+    response bytes, so every hit is decoded into fresh objects.
+
+    ``generation`` counts invalidations. Reading it before sending a request
+    and passing it to ``set`` keeps a response that was in flight during a
+    write from being cached after the write invalidated its path.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: OrderedDict[CacheKey, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, params: dict[str, Any] | None) -> CacheKey:
+        """Build the cache key for a request."""
+        return (path, tuple(sorted(params.items())) if params else ())
+
+    def get(self, key: CacheKey) -> bytes | None:
+        """Return the cached body for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, content = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return content
+
+    def set(self, key: CacheKey, content: bytes, generation: int | None = None) -> None:
+        """Store a response body, evicting the least recently used entry.
+
+        Nothing is stored if ``generation`` is given and the cache has been
+        invalidated since it was read.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Drop every entry whose path starts with one of ``prefixes``."""
+        with self._lock:
+            self.generation += 1
+            for key in [k for k in self._entries if k[0].startswith(prefixes)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
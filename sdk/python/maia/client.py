@@ -1,12 +1,33 @@
 """MAIA SDK Client."""
 
-from typing import Any
-from urllib.parse import quote, urlencode
+import asyncio
+import atexit
+import base64
+import contextlib
+import math
+import re
+import struct
+import threading
+import warnings
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, TypeVar
+from urllib.parse import quote
 
 import httpx
-
-from maia.errors import APIError, NetworkError, ValidationError
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from maia._cache import CacheKey, ResponseCache
+from maia.errors import (
+    AlreadyExistsError,
+    APIError,
+    NetworkError,
+    NotFoundError,
+    ValidationError,
+)
 from maia.types import (
+    BatchCall,
+    BatchResponse,
     ContextResponse,
     CreateMemoryInput,
     CreateNamespaceInput,
@@ -14,11 +35,13 @@ from maia.types import (
     GetContextInput,
     HealthResponse,
     ListOptions,
-    ListResponse,
     Memory,
+    MemoryListResponse,
     MemorySource,
     MemoryType,
     Namespace,
+    NamespaceListResponse,
+    SearchListResponse,
     SearchMemoriesInput,
     SearchResult,
     Stats,
@@ -28,6 +51,285 @@ from maia.types import (
 
 DEFAULT_BASE_URL = "http://localhost:8080"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_CACHE_TTL = 5.0
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=15.0,
+)
+FEATURE_BATCH = "batch"
+FEATURE_EMBEDDING_FP16 = "embedding_fp16_b64"
+FEATURE_EMBEDDING_INT8 = "embedding_int8_b64"
+
+# Largest finite float16 value; struct.pack("e") overflows above it.
+_FP16_MAX = 65504.0
+
+_EMBEDDING_FEATURES = {
+    "fp16_b64": FEATURE_EMBEDDING_FP16,
+    "int8_b64": FEATURE_EMBEDDING_INT8,
+}
+
+_JSON_HEADERS = {"content-type": "application/json"}
+# NumPy embeddings are written by orjson directly instead of via Python lists.
+_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+# Parsed once so the create-memory hot path skips URL parsing.
+_MEMORIES_URL = httpx.URL("/v1/memories")
+
+# Pre-serialized fields shared by every remember() call, so the hot path
+# skips building and dumping a CreateMemoryInput.
+_TYPE_SEMANTIC = MemoryType.SEMANTIC.value
+_SOURCE_USER = MemorySource.USER.value
+_REMEMBER_TEMPLATE: dict[str, Any] = {
+    "type": _TYPE_SEMANTIC,
+    "source": _SOURCE_USER,
+    "confidence": 1.0,
+}
+
+_MEMORY_LIST_ADAPTER = TypeAdapter(MemoryListResponse)
+_SEARCH_LIST_ADAPTER = TypeAdapter(SearchListResponse)
+_NAMESPACE_LIST_ADAPTER = TypeAdapter(NamespaceListResponse)
+
+# IDs made only of characters that quote() never escapes (the common UUID
+# case) can be used in paths as-is.
+_SAFE_ID_RE = re.compile(r"\A[A-Za-z0-9._~-]+\Z")
+
+M = TypeVar("M", bound=BaseModel)
+
+# Error classes for statuses that have one, with the code they stand for. A
+# response with a different code (e.g. a 409 VERSION_CONFLICT) stays an
+# APIError.
+_STATUS_TO_ERROR: dict[
+    int, tuple[type[NotFoundError] | type[AlreadyExistsError], str]
+] = {
+    404: (NotFoundError, "NOT_FOUND"),
+    409: (AlreadyExistsError, "ALREADY_EXISTS"),
+}
+
+
+def _parse(model: type[M], data: Any, trust_server: bool) -> M:
+    """Parse a flat response model, skipping validation for trusted servers.
+
+    Only used for models without nested models, since ``model_construct``
+    leaves the raw JSON values (strings for datetimes and enums) untouched.
+    """
+    if trust_server:
+        return model.model_construct(**data)
+    return model.model_validate(data)
+
+
+def _api_error(status_code: int, body: Any) -> APIError:
+    """Build the most specific APIError for a decoded error response body."""
+    if not isinstance(body, dict):
+        body = {}
+    message = body.get("error") or f"HTTP {status_code}"
+    code = body.get("code")
+    mapped = _STATUS_TO_ERROR.get(status_code)
+    if mapped is not None and code in (None, mapped[1]):
+        return mapped[0](message=message, code=code, details=body.get("details"))
+    return APIError(
+        status_code=status_code,
+        message=message,
+        code=code,
+        details=body.get("details"),
+    )
+
+
+def _raise_for_response(response: httpx.Response) -> None:
+    """Raise an APIError if the response has an error status."""
+    if response.status_code < 400:
+        return
+    try:
+        data = orjson.loads(response.content)
+    except ValueError:
+        # Plain-text and empty bodies still map to the status-specific errors.
+        body = {"error": response.text} if response.text else {}
+        raise _api_error(response.status_code, body) from None
+    raise _api_error(response.status_code, data)
+
+
+def _dumps(body: Any | None) -> bytes | None:
+    """Serialize a request body, or return None when there is none."""
+    return orjson.dumps(body, option=_DUMPS_OPTIONS) if body is not None else None
+
+
+def _decode(content: bytes) -> Any:
+    """Decode a successful response body, or None if it is empty."""
+    return orjson.loads(content) if content else None
+
+
+def _import_ijson() -> Any:
+    """Import ijson, which is only needed for streaming responses."""
+    try:
+        import ijson  # type: ignore[import-untyped]
+    except ImportError as e:
+        raise ImportError(
+            "Streaming responses require the 'ijson' package. "
+            'Install it with `pip install "maia-sdk[streaming]"`.'
+        ) from e
+    return ijson
+
+
+def _escape(segment: str) -> str:
+    """Percent-encode a path segment, skipping quote() for safe IDs."""
+    return segment if _SAFE_ID_RE.match(segment) else quote(segment, safe="")
+
+
+def _memory_path(id: str) -> str:
+    """Build the path of a single memory."""
+    return f"/v1/memories/{_escape(id)}"
+
+
+def _namespace_path(id_or_name: str) -> str:
+    """Build the path of a single namespace."""
+    return f"/v1/namespaces/{_escape(id_or_name)}"
+
+
+def _paginate_params(options: ListOptions | None) -> dict[str, int] | None:
+    """Build list query parameters, or None when no pagination is set."""
+    if options is None or not (options.limit or options.offset):
+        return None
+    return {
+        k: v for k, v in (("limit", options.limit), ("offset", options.offset)) if v
+    }
+
+
+def _memory_list_params(options: ListOptions | None) -> dict[str, Any]:
+    """Build query parameters for listing memories."""
+    params: dict[str, Any] = _paginate_params(options) or {}
+    params["include_embeddings"] = bool(options and options.include_embeddings)
+    return params
+
+
+def _search_body(input: SearchMemoriesInput) -> dict[str, Any]:
+    """Build a search request body, excluding embeddings unless requested."""
+    body = input.model_dump(exclude_none=True)
+    body.setdefault("include_embeddings", False)
+    return body
+
+
+def _drop_embedding(item: dict[str, Any]) -> dict[str, Any]:
+    """Remove the embedding from a memory or search result item in place.
+
+    Servers that ignore ``include_embeddings`` still send the vectors, so they
+    are dropped before validation to avoid building a float list per memory.
+    """
+    memory = item.get("memory", item)
+    if isinstance(memory, dict):
+        memory.pop("embedding", None)
+    return item
+
+
+def _drop_embeddings(data: Any) -> Any:
+    """Remove embeddings from every item of a list response in place.
+
+    Bodies that aren't JSON objects are returned untouched and left for
+    validation to reject.
+    """
+    if not isinstance(data, dict):
+        return data
+    for item in data.get("data") or ():
+        if isinstance(item, dict):
+            _drop_embedding(item)
+    return data
+
+
+def _has_embedding(input: CreateMemoryInput) -> bool:
+    """Tell whether the input carries a non-empty embedding."""
+    return input.embedding is not None and len(input.embedding) > 0
+
+
+def _check_embedding(finite: bool, peak: float, encoding: str) -> None:
+    """Raise ValidationError if an embedding can't be sent with ``encoding``.
+
+    ``finite`` tells whether every value is finite and ``peak`` is the largest
+    magnitude among them.
+    """
+    if not finite:
+        raise ValidationError("embedding", "embedding values must be finite")
+    if encoding == "fp16_b64" and peak > _FP16_MAX:
+        raise ValidationError(
+            "embedding",
+            f"embedding values must be within ±{_FP16_MAX:g} for fp16_b64",
+        )
+
+
+def _encode_embedding(embedding: Any, encoding: str) -> dict[str, Any]:
+    """Encode an embedding into the compact request body fields."""
+    if not isinstance(embedding, list):
+        return _encode_ndarray(embedding, encoding)
+
+    n = len(embedding)
+    peak = max(map(abs, embedding), default=0.0)
+    _check_embedding(all(map(math.isfinite, embedding)), peak, encoding)
+    if encoding == "fp16_b64":
+        raw = struct.pack(f"<{n}e", *embedding)
+        return {
+            "embedding": base64.b64encode(raw).decode("ascii"),
+            "embedding_encoding": encoding,
+        }
+
+    # A subnormal peak can underflow to 0.0, so test the scale, not the peak.
+    scale = peak / 127 or 1.0
+    raw = struct.pack(f"<{n}b", *(round(v / scale) for v in embedding))
+    return {
+        "embedding": base64.b64encode(raw).decode("ascii"),
+        "embedding_encoding": encoding,
+        "embedding_scale": scale,
+    }
+
+
+def _encode_ndarray(embedding: Any, encoding: str) -> dict[str, Any]:
+    """Encode a NumPy embedding, matching ``_encode_embedding``."""
+    # NaN propagates through max(), so a finite peak means finite values.
+    peak = float(abs(embedding).max()) if embedding.size else 0.0
+    _check_embedding(math.isfinite(peak), peak, encoding)
+    if encoding == "fp16_b64":
+        raw = embedding.astype("<f2").tobytes()
+        return {
+            "embedding": base64.b64encode(raw).decode("ascii"),
+            "embedding_encoding": encoding,
+        }
+
+    scale = peak / 127 or 1.0
+    # Divide in float64 like the list path, so both round the same way.
+    raw = (embedding.astype("<f8") / scale).round().astype("<i1").tobytes()
+    return {
+        "embedding": base64.b64encode(raw).decode("ascii"),
+        "embedding_encoding": encoding,
+        "embedding_scale": scale,
+    }
+
+
+def _create_memory_body(input: CreateMemoryInput, encode: bool) -> dict[str, Any]:
+    """Build a create-memory request body.
+
+    ``encode`` tells whether the server accepts the requested compact
+    embedding encoding; otherwise the embedding is sent as JSON floats.
+    """
+    body = input.model_dump(exclude_none=True, exclude={"embedding_encoding"})
+    if encode and _has_embedding(input):
+        body.update(_encode_embedding(input.embedding, input.embedding_encoding))
+    return body
+
+
+def _remember_payload(namespace: str, content: str) -> dict[str, Any]:
+    """Build the request body used by the remember convenience methods."""
+    return {**_REMEMBER_TEMPLATE, "namespace": namespace, "content": content}
+
+
+def _batch_calls(calls: list[BatchCall]) -> dict[str, Any]:
+    """Serialize batch calls into a /v1/batch request body."""
+    return {"calls": [c.model_dump(by_alias=True, exclude_none=True) for c in calls]}
+
+
+def _batch_results(data: Any) -> list[Any]:
+    """Unwrap a /v1/batch response, raising on the first failed call."""
+    results = []
+    for result in BatchResponse.model_validate(data).results:
+        if result.status >= 400:
+            raise _api_error(result.status, result.body)
+        results.append(result.body)
+    return results
 
 
 class MAIAClient:
@@ -52,6 +354,12 @@ class MAIAClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         headers: dict[str, str] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        trust_server: bool = False,
+        cache_size: int = 0,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         """Initialize the MAIA client.
 
@@ -59,12 +367,36 @@ class MAIAClient:
             base_url: Base URL of the MAIA server.
             timeout: Request timeout in seconds.
             headers: Custom headers to include in all requests.
+            limits: Connection pool limits. Defaults to ``DEFAULT_LIMITS``,
+                which keeps idle connections alive for 15 seconds so bursts
+                of small requests reuse connections instead of reconnecting.
+            http2: Enable HTTP/2. Requires the ``h2`` package. Multiplexes
+                concurrent requests to the same host over one connection,
+                which mostly benefits the async client.
+            trust_server: Build memory, health and stats responses with
+                ``model_construct`` instead of validating them. Faster, but
+                fields are left as sent by the server (e.g. timestamps stay
+                ISO strings), so only enable it for trusted servers.
+            cache_size: Maximum number of GET responses (memories,
+                namespaces, lists, health and stats) to cache. Caching is
+                disabled when 0. Writes made through this client invalidate
+                the affected entries; writes by other clients are only seen
+                once entries expire. ``ready()`` is never cached.
+            cache_ttl: Seconds a cached response stays valid.
+            transport: Custom httpx transport, such as ``httpx.MockTransport``
+                in tests. ``limits`` and ``http2`` are ignored when set.
         """
         self.base_url = base_url.rstrip("/")
+        self._trust_server = trust_server
+        self._features: frozenset[str] | None = None
+        self._cache = ResponseCache(cache_size, cache_ttl) if cache_size > 0 else None
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
             headers=headers or {},
+            limits=limits if limits is not None else DEFAULT_LIMITS,
+            http2=http2,
+            transport=transport,
         )
 
     def __enter__(self) -> "MAIAClient":
@@ -80,79 +412,164 @@ class MAIAClient:
     def _request(
         self,
         method: str,
-        path: str,
+        path: str | httpx.URL,
         json: Any | None = None,
         params: dict[str, Any] | None = None,
     ) -> Any:
         """Perform an HTTP request."""
+        if method == "GET":
+            return self._get_json(path, params)
+
+        request = self._client.build_request(
+            method,
+            path,
+            content=_dumps(json),
+            headers=_JSON_HEADERS if json is not None else None,
+            params=params,
+        )
+        return _decode(self._send(request).content)
+
+    def _get_json(
+        self, path: str | httpx.URL, params: dict[str, Any] | None = None
+    ) -> Any:
+        """Perform a GET request, serving it from the cache when enabled."""
+        cache = self._cache
+        if cache is not None:
+            key = cache.key(str(path), params)
+            cached = cache.get(key)
+            if cached is not None:
+                return _decode(cached)
+            generation = cache.generation
+
+        response = self._send(self._client.build_request("GET", path, params=params))
+        if cache is not None:
+            cache.set(key, response.content, generation)
+        return _decode(response.content)
+
+    def _post_json(self, path: str | httpx.URL, body: Any) -> Any:
+        """Perform a POST request with a JSON body."""
+        request = self._client.build_request(
+            "POST", path, content=_dumps(body), headers=_JSON_HEADERS
+        )
+        return _decode(self._send(request).content)
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a prepared request, raising for error responses."""
+        try:
+            response = self._client.send(request)
+        except httpx.RequestError as e:
+            raise NetworkError(f"Request failed: {e}", e) from e
+
+        _raise_for_response(response)
+        return response
+
+    def _invalidate(self, *prefixes: str) -> None:
+        """Drop cached responses for paths starting with ``prefixes``."""
+        if self._cache is not None:
+            self._cache.invalidate(*prefixes)
+
+    def _stream_items(
+        self,
+        method: str,
+        path: str,
+        model: type[M],
+        json: Any | None = None,
+        params: dict[str, Any] | None = None,
+        include_embeddings: bool = True,
+        trust_server: bool = False,
+    ) -> Iterator[M]:
+        """Perform an HTTP request and parse list items as they arrive.
+
+        ``trust_server`` is passed to ``_parse``, so it must only be set for
+        flat models.
+        """
+        ijson = _import_ijson()
         try:
-            response = self._client.request(
+            with self._client.stream(
                 method,
                 path,
-                json=json,
+                content=_dumps(json),
+                headers=_JSON_HEADERS if json is not None else None,
                 params=params,
-            )
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    _raise_for_response(response)
+
+                items: list[Any] = ijson.sendable_list()
+                parser = ijson.items_coro(items, "data.item", use_float=True)
+                for chunk in response.iter_bytes():
+                    parser.send(chunk)
+                    for item in items:
+                        if not include_embeddings:
+                            _drop_embedding(item)
+                        yield _parse(model, item, trust_server)
+                    del items[:]
+                parser.close()
+                for item in items:
+                    if not include_embeddings:
+                        _drop_embedding(item)
+                    yield _parse(model, item, trust_server)
         except httpx.RequestError as e:
             raise NetworkError(f"Request failed: {e}", e) from e
 
-        if response.status_code >= 400:
-            try:
-                data = response.json()
-                raise APIError(
-                    status_code=response.status_code,
-                    message=data.get("error", f"HTTP {response.status_code}"),
-                    code=data.get("code"),
-                    details=data.get("details"),
-                )
-            except ValueError:
-                raise APIError(
-                    status_code=response.status_code,
-                    message=response.text or f"HTTP {response.status_code}",
-                )
-
-        if response.content:
-            return response.json()
-        return None
-
     # ============== Health ==============
 
     def health(self) -> HealthResponse:
         """Check if the server is healthy."""
-        data = self._request("GET", "/health")
-        return HealthResponse.model_validate(data)
+        data = self._get_json("/health")
+        return _parse(HealthResponse, data, self._trust_server)
 
     def ready(self) -> None:
         """Check if the server is ready to serve requests."""
-        self._request("GET", "/ready")
+        # Never cached, so a failing server is reported straight away.
+        self._send(self._client.build_request("GET", "/ready"))
 
     def stats(self) -> Stats:
         """Get storage statistics."""
-        data = self._request("GET", "/v1/stats")
-        return Stats.model_validate(data)
+        data = self._get_json("/v1/stats")
+        return _parse(Stats, data, self._trust_server)
+
+    def supports(self, feature: str) -> bool:
+        """Check whether the server advertises an optional feature.
+
+        Features are read from the health response once and cached for the
+        lifetime of the client.
+        """
+        if self._features is None:
+            self._features = frozenset(self.health().features or ())
+        return feature in self._features
 
     # ============== Memories ==============
 
     def create_memory(self, input: CreateMemoryInput) -> Memory:
-        """Create a new memory."""
+        """Create a new memory.
+
+        Embeddings are sent with ``input.embedding_encoding`` when the server
+        advertises support for it, and as JSON floats otherwise. Values the
+        compact encoding can't represent (NaN, infinities, or magnitudes above
+        the float16 range for ``fp16_b64``) raise ``ValidationError``.
+        """
         if not input.namespace:
             raise ValidationError("namespace", "namespace is required")
         if not input.content:
             raise ValidationError("content", "content is required")
 
-        data = self._request(
-            "POST",
-            "/v1/memories",
-            json=input.model_dump(exclude_none=True),
+        feature = _EMBEDDING_FEATURES.get(input.embedding_encoding)
+        encode = (
+            feature is not None and _has_embedding(input) and self.supports(feature)
         )
-        return Memory.model_validate(data)
+        data = self._post_json(_MEMORIES_URL, _create_memory_body(input, encode))
+        self._invalidate(f"{_namespace_path(input.namespace)}/memories", "/v1/stats")
+        return _parse(Memory, data, self._trust_server)
 
     def get_memory(self, id: str) -> Memory:
         """Get a memory by ID."""
         if not id:
             raise ValidationError("id", "id is required")
 
-        data = self._request("GET", f"/v1/memories/{quote(id, safe='')}")
-        return Memory.model_validate(data)
+        data = self._get_json(_memory_path(id))
+        return _parse(Memory, data, self._trust_server)
 
     def update_memory(self, id: str, input: UpdateMemoryInput) -> Memory:
         """Update an existing memory."""
@@ -161,31 +578,57 @@ class MAIAClient:
 
         data = self._request(
             "PUT",
-            f"/v1/memories/{quote(id, safe='')}",
+            _memory_path(id),
             json=input.model_dump(exclude_none=True),
         )
-        return Memory.model_validate(data)
+        memory = _parse(Memory, data, self._trust_server)
+        self._invalidate(
+            _memory_path(id), f"{_namespace_path(memory.namespace)}/memories"
+        )
+        return memory
 
     def delete_memory(self, id: str) -> None:
         """Delete a memory by ID."""
         if not id:
             raise ValidationError("id", "id is required")
 
-        self._request("DELETE", f"/v1/memories/{quote(id, safe='')}")
+        self._request("DELETE", _memory_path(id))
+        # The memory's namespace is unknown here, so every cached namespace
+        # response is dropped along with the memory itself.
+        self._invalidate(_memory_path(id), "/v1/namespaces/", "/v1/stats")
 
     def search_memories(
         self, input: SearchMemoriesInput | None = None
-    ) -> ListResponse[SearchResult]:
+    ) -> SearchListResponse:
         """Search for memories."""
         if input is None:
             input = SearchMemoriesInput()
 
-        data = self._request(
+        data = self._post_json("/v1/memories/search", _search_body(input))
+        if not input.include_embeddings:
+            _drop_embeddings(data)
+        return _SEARCH_LIST_ADAPTER.validate_python(data)
+
+    def stream_search_memories(
+        self, input: SearchMemoriesInput | None = None
+    ) -> Iterator[SearchResult]:
+        """Search for memories, yielding results as they arrive.
+
+        Unlike ``search_memories`` the response body is parsed incrementally,
+        so large result sets are never held in memory all at once. Requires
+        the ``ijson`` package (``pip install "maia-sdk[streaming]"``).
+        """
+        if input is None:
+            input = SearchMemoriesInput()
+
+        return self._stream_items(
             "POST",
             "/v1/memories/search",
-            json=input.model_dump(exclude_none=True),
+            # SearchResult nests a Memory, so it is always validated.
+            SearchResult,
+            json=_search_body(input),
+            include_embeddings=bool(input.include_embeddings),
         )
-        return ListResponse[SearchResult].model_validate(data)
 
     # ============== Namespaces ==============
 
@@ -194,11 +637,11 @@ class MAIAClient:
         if not input.name:
             raise ValidationError("name", "name is required")
 
-        data = self._request(
-            "POST",
+        data = self._post_json(
             "/v1/namespaces",
-            json=input.model_dump(exclude_none=True),
+            input.model_dump(exclude_none=True),
         )
+        self._invalidate("/v1/namespaces", "/v1/stats")
         return Namespace.model_validate(data)
 
     def get_namespace(self, id_or_name: str) -> Namespace:
@@ -206,7 +649,7 @@ class MAIAClient:
         if not id_or_name:
             raise ValidationError("id_or_name", "id or name is required")
 
-        data = self._request("GET", f"/v1/namespaces/{quote(id_or_name, safe='')}")
+        data = self._get_json(_namespace_path(id_or_name))
         return Namespace.model_validate(data)
 
     def update_namespace(self, id: str, input: UpdateNamespaceInput) -> Namespace:
@@ -216,9 +659,10 @@ class MAIAClient:
 
         data = self._request(
             "PUT",
-            f"/v1/namespaces/{quote(id, safe='')}",
+            _namespace_path(id),
             json=input.model_dump(exclude_none=True),
         )
+        self._invalidate("/v1/namespaces")
         return Namespace.model_validate(data)
 
     def delete_namespace(self, id: str) -> None:
@@ -226,42 +670,53 @@ class MAIAClient:
         if not id:
             raise ValidationError("id", "id is required")
 
-        self._request("DELETE", f"/v1/namespaces/{quote(id, safe='')}")
+        self._request("DELETE", _namespace_path(id))
+        self._invalidate("/v1/namespaces", "/v1/stats")
 
     def list_namespaces(
         self, options: ListOptions | None = None
-    ) -> ListResponse[Namespace]:
+    ) -> NamespaceListResponse:
         """List all namespaces."""
-        params = {}
-        if options:
-            if options.limit:
-                params["limit"] = options.limit
-            if options.offset:
-                params["offset"] = options.offset
-
-        data = self._request("GET", "/v1/namespaces", params=params or None)
-        return ListResponse[Namespace].model_validate(data)
+        data = self._request("GET", "/v1/namespaces", params=_paginate_params(options))
+        return _NAMESPACE_LIST_ADAPTER.validate_python(data)
 
     def list_namespace_memories(
         self, namespace: str, options: ListOptions | None = None
-    ) -> ListResponse[Memory]:
+    ) -> MemoryListResponse:
         """List memories in a namespace."""
         if not namespace:
             raise ValidationError("namespace", "namespace is required")
 
-        params = {}
-        if options:
-            if options.limit:
-                params["limit"] = options.limit
-            if options.offset:
-                params["offset"] = options.offset
-
         data = self._request(
             "GET",
-            f"/v1/namespaces/{quote(namespace, safe='')}/memories",
-            params=params or None,
+            f"{_namespace_path(namespace)}/memories",
+            params=_memory_list_params(options),
+        )
+        if not (options and options.include_embeddings):
+            _drop_embeddings(data)
+        return _MEMORY_LIST_ADAPTER.validate_python(data)
+
+    def stream_list_namespace_memories(
+        self, namespace: str, options: ListOptions | None = None
+    ) -> Iterator[Memory]:
+        """List memories in a namespace, yielding them as they arrive.
+
+        Unlike ``list_namespace_memories`` the response body is parsed
+        incrementally, so large namespaces are never held in memory all at
+        once. Requires the ``ijson`` package
+        (``pip install "maia-sdk[streaming]"``).
+        """
+        if not namespace:
+            raise ValidationError("namespace", "namespace is required")
+
+        return self._stream_items(
+            "GET",
+            f"{_namespace_path(namespace)}/memories",
+            Memory,
+            params=_memory_list_params(options),
+            include_embeddings=bool(options and options.include_embeddings),
+            trust_server=self._trust_server,
         )
-        return ListResponse[Memory].model_validate(data)
 
     # ============== Context ==============
 
@@ -270,13 +725,38 @@ class MAIAClient:
         if not input.query:
             raise ValidationError("query", "query is required")
 
-        data = self._request(
-            "POST",
+        data = self._post_json(
             "/v1/context",
-            json=input.model_dump(exclude_none=True),
+            input.model_dump(exclude_none=True),
         )
         return ContextResponse.model_validate(data)
 
+    # ============== Batch ==============
+
+    def batch(self, calls: list[BatchCall]) -> list[Any]:
+        """Execute several API calls in a single round trip.
+
+        Requires a server that advertises the ``batch`` feature. Returns the
+        decoded body of each call, in order, and raises ``APIError`` for the
+        first call that failed.
+
+        Example:
+            ```python
+            results = client.batch([
+                BatchCall(method="GET", path="/v1/memories/mem-1"),
+                BatchCall(method="GET", path="/v1/memories/mem-2"),
+            ])
+            ```
+        """
+        if not calls:
+            return []
+
+        data = self._post_json("/v1/batch", _batch_calls(calls))
+        # Write sub-calls may touch anything, so nothing cached can be trusted.
+        if any(call.method.upper() != "GET" for call in calls):
+            self._invalidate("/")
+        return _batch_results(data)
+
     # ============== Convenience Methods ==============
 
     def remember(self, namespace: str, content: str) -> Memory:
@@ -287,15 +767,14 @@ class MAIAClient:
             memory = client.remember("default", "User prefers dark mode")
             ```
         """
-        return self.create_memory(
-            CreateMemoryInput(
-                namespace=namespace,
-                content=content,
-                type=MemoryType.SEMANTIC,
-                source=MemorySource.USER,
-                confidence=1.0,
-            )
-        )
+        if not namespace:
+            raise ValidationError("namespace", "namespace is required")
+        if not content:
+            raise ValidationError("content", "content is required")
+
+        data = self._post_json(_MEMORIES_URL, _remember_payload(namespace, content))
+        self._invalidate(f"{_namespace_path(namespace)}/memories", "/v1/stats")
+        return _parse(Memory, data, self._trust_server)
 
     def recall(
         self,
@@ -339,6 +818,61 @@ class MAIAClient:
         """
         self.delete_memory(id)
 
+    def get_memories(self, ids: list[str]) -> list[Memory]:
+        """Get several memories by ID (convenience method).
+
+        Uses a single batch request when the server supports it and falls back
+        to one request per memory otherwise.
+
+        Example:
+            ```python
+            memories = client.get_memories(["mem-1", "mem-2"])
+            ```
+        """
+        if not ids:
+            return []
+        if not all(ids):
+            raise ValidationError("id", "id is required")
+        if not self.supports(FEATURE_BATCH):
+            return [self.get_memory(id) for id in ids]
+
+        results = self.batch(
+            [BatchCall(method="GET", path=_memory_path(id)) for id in ids]
+        )
+        return [_parse(Memory, r, self._trust_server) for r in results]
+
+    def remember_many(self, namespace: str, contents: list[str]) -> list[Memory]:
+        """Store several semantic memories (convenience method).
+
+        Uses a single batch request when the server supports it and falls back
+        to one request per memory otherwise.
+
+        Example:
+            ```python
+            memories = client.remember_many("default", ["fact 1", "fact 2"])
+            ```
+        """
+        if not namespace:
+            raise ValidationError("namespace", "namespace is required")
+        if not contents:
+            return []
+        if not all(contents):
+            raise ValidationError("content", "content is required")
+        if not self.supports(FEATURE_BATCH):
+            return [self.remember(namespace, content) for content in contents]
+
+        results = self.batch(
+            [
+                BatchCall(
+                    method="POST",
+                    path="/v1/memories",
+                    json=_remember_payload(namespace, content),
+                )
+                for content in contents
+            ]
+        )
+        return [_parse(Memory, r, self._trust_server) for r in results]
+
 
 class AsyncMAIAClient:
     """Asynchronous MAIA SDK client.
@@ -361,6 +895,12 @@ class AsyncMAIAClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         headers: dict[str, str] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        trust_server: bool = False,
+        cache_size: int = 0,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize the async MAIA client.
 
@@ -368,12 +908,37 @@ class AsyncMAIAClient:
             base_url: Base URL of the MAIA server.
             timeout: Request timeout in seconds.
             headers: Custom headers to include in all requests.
+            limits: Connection pool limits. Defaults to ``DEFAULT_LIMITS``,
+                which keeps idle connections alive for 15 seconds so bursts
+                of small requests reuse connections instead of reconnecting.
+            http2: Enable HTTP/2. Requires the ``h2`` package. Multiplexes
+                concurrent requests to the same host over one connection,
+                which mostly benefits the async client.
+            trust_server: Build memory, health and stats responses with
+                ``model_construct`` instead of validating them. Faster, but
+                fields are left as sent by the server (e.g. timestamps stay
+                ISO strings), so only enable it for trusted servers.
+            cache_size: Maximum number of GET responses (memories,
+                namespaces, lists, health and stats) to cache. Caching is
+                disabled when 0. Writes made through this client invalidate
+                the affected entries; writes by other clients are only seen
+                once entries expire. ``ready()`` is never cached.
+            cache_ttl: Seconds a cached response stays valid.
+            transport: Custom httpx transport, such as ``httpx.MockTransport``
+                in tests. ``limits`` and ``http2`` are ignored when set.
         """
         self.base_url = base_url.rstrip("/")
+        self._trust_server = trust_server
+        self._features: frozenset[str] | None = None
+        self._cache = ResponseCache(cache_size, cache_ttl) if cache_size > 0 else None
+        self._inflight: dict[CacheKey, asyncio.Future[bytes]] = {}
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=timeout,
             headers=headers or {},
+            limits=limits if limits is not None else DEFAULT_LIMITS,
+            http2=http2,
+            transport=transport,
         )
 
     async def __aenter__(self) -> "AsyncMAIAClient":
@@ -386,82 +951,223 @@ class AsyncMAIAClient:
         """Close the client."""
         await self._client.aclose()
 
+    def __del__(self) -> None:
+        client = getattr(self, "_client", None)
+        if client is not None and not client.is_closed:
+            warnings.warn(
+                f"Unclosed {type(self).__name__}; call close() or use "
+                "'async with', or share one via get_default_async_client()",
+                ResourceWarning,
+                stacklevel=2,
+            )
+
     async def _request(
         self,
         method: str,
-        path: str,
+        path: str | httpx.URL,
         json: Any | None = None,
         params: dict[str, Any] | None = None,
     ) -> Any:
         """Perform an HTTP request."""
+        if method == "GET":
+            return await self._get_json(path, params)
+
+        request = self._client.build_request(
+            method,
+            path,
+            content=_dumps(json),
+            headers=_JSON_HEADERS if json is not None else None,
+            params=params,
+        )
+        return _decode((await self._send(request)).content)
+
+    async def _get_json(
+        self, path: str | httpx.URL, params: dict[str, Any] | None = None
+    ) -> Any:
+        """Perform a GET request, serving it from the cache when enabled.
+
+        Concurrent GETs for the same path and params share one in-flight
+        request; each caller decodes its own copy of the response.
+        """
+        key = ResponseCache.key(str(path), params)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return _decode(cached)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(path, params, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._inflight_done(key, t))
+        # Shield so one caller being cancelled doesn't cancel the others.
+        return _decode(await asyncio.shield(task))
+
+    async def _post_json(self, path: str | httpx.URL, body: Any) -> Any:
+        """Perform a POST request with a JSON body."""
+        request = self._client.build_request(
+            "POST", path, content=_dumps(body), headers=_JSON_HEADERS
+        )
+        return _decode((await self._send(request)).content)
+
+    async def _fetch(
+        self, path: str | httpx.URL, params: dict[str, Any] | None, key: CacheKey
+    ) -> bytes:
+        """Send a GET request, cache the body and return it."""
+        cache = self._cache
+        generation = cache.generation if cache is not None else None
+        request = self._client.build_request("GET", path, params=params)
+        response = await self._send(request)
+        if cache is not None:
+            cache.set(key, response.content, generation)
+        return response.content
+
+    def _inflight_done(self, key: CacheKey, task: "asyncio.Future[bytes]") -> None:
+        """Forget a finished in-flight request."""
+        # A write may already have replaced it with a newer request.
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the error retrieved in case every caller was cancelled.
+            task.exception()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a prepared request, raising for error responses."""
         try:
-            response = await self._client.request(
+            response = await self._client.send(request)
+        except httpx.RequestError as e:
+            raise NetworkError(f"Request failed: {e}", e) from e
+
+        _raise_for_response(response)
+        return response
+
+    def _invalidate(self, *prefixes: str) -> None:
+        """Drop cached responses for paths starting with ``prefixes``.
+
+        In-flight GETs for those paths are forgotten as well, so later calls
+        send a new request instead of joining one sent before the write.
+        """
+        if self._cache is not None:
+            self._cache.invalidate(*prefixes)
+        for key in [k for k in self._inflight if k[0].startswith(prefixes)]:
+            del self._inflight[key]
+
+    async def _stream_items(
+        self,
+        method: str,
+        path: str,
+        model: type[M],
+        json: Any | None = None,
+        params: dict[str, Any] | None = None,
+        include_embeddings: bool = True,
+        trust_server: bool = False,
+    ) -> AsyncIterator[M]:
+        """Perform an HTTP request and parse list items as they arrive.
+
+        ``trust_server`` is passed to ``_parse``, so it must only be set for
+        flat models.
+        """
+        ijson = _import_ijson()
+        try:
+            async with self._client.stream(
                 method,
                 path,
-                json=json,
+                content=_dumps(json),
+                headers=_JSON_HEADERS if json is not None else None,
                 params=params,
-            )
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    _raise_for_response(response)
+
+                items: list[Any] = ijson.sendable_list()
+                parser = ijson.items_coro(items, "data.item", use_float=True)
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for item in items:
+                        if not include_embeddings:
+                            _drop_embedding(item)
+                        yield _parse(model, item, trust_server)
+                    del items[:]
+                parser.close()
+                for item in items:
+                    if not include_embeddings:
+                        _drop_embedding(item)
+                    yield _parse(model, item, trust_server)
         except httpx.RequestError as e:
             raise NetworkError(f"Request failed: {e}", e) from e
 
-        if response.status_code >= 400:
-            try:
-                data = response.json()
-                raise APIError(
-                    status_code=response.status_code,
-                    message=data.get("error", f"HTTP {response.status_code}"),
-                    code=data.get("code"),
-                    details=data.get("details"),
-                )
-            except ValueError:
-                raise APIError(
-                    status_code=response.status_code,
-                    message=response.text or f"HTTP {response.status_code}",
-                )
-
-        if response.content:
-            return response.json()
-        return None
-
     # ============== Health ==============
 
     async def health(self) -> HealthResponse:
         """Check if the server is healthy."""
-        data = await self._request("GET", "/health")
-        return HealthResponse.model_validate(data)
+        data = await self._get_json("/health")
+        return _parse(HealthResponse, data, self._trust_server)
 
     async def ready(self) -> None:
         """Check if the server is ready to serve requests."""
-        await self._request("GET", "/ready")
+        # Never cached, so a failing server is reported straight away.
+        await self._send(self._client.build_request("GET", "/ready"))
 
     async def stats(self) -> Stats:
         """Get storage statistics."""
-        data = await self._request("GET", "/v1/stats")
-        return Stats.model_validate(data)
+        data = await self._get_json("/v1/stats")
+        return _parse(Stats, data, self._trust_server)
+
+    async def supports(self, feature: str) -> bool:
+        """Check whether the server advertises an optional feature.
+
+        Features are read from the health response once and cached for the
+        lifetime of the client.
+        """
+        if self._features is None:
+            self._features = frozenset((await self.health()).features or ())
+        return feature in self._features
 
     # ============== Memories ==============
 
     async def create_memory(self, input: CreateMemoryInput) -> Memory:
-        """Create a new memory."""
+        """Create a new memory.
+
+        Embeddings are sent with ``input.embedding_encoding`` when the server
+        advertises support for it, and as JSON floats otherwise. Values the
+        compact encoding can't represent (NaN, infinities, or magnitudes above
+        the float16 range for ``fp16_b64``) raise ``ValidationError``.
+        """
         if not input.namespace:
             raise ValidationError("namespace", "namespace is required")
         if not input.content:
             raise ValidationError("content", "content is required")
 
-        data = await self._request(
-            "POST",
-            "/v1/memories",
-            json=input.model_dump(exclude_none=True),
+        feature = _EMBEDDING_FEATURES.get(input.embedding_encoding)
+        encode = (
+            feature is not None
+            and _has_embedding(input)
+            and await self.supports(feature)
         )
-        return Memory.model_validate(data)
+        data = await self._post_json(_MEMORIES_URL, _create_memory_body(input, encode))
+        self._invalidate(f"{_namespace_path(input.namespace)}/memories", "/v1/stats")
+        return _parse(Memory, data, self._trust_server)
 
     async def get_memory(self, id: str) -> Memory:
-        """Get a memory by ID."""
+        """Get a memory by ID.
+
+        Fetching many memories concurrently is cheapest over HTTP/2, where
+        every request shares one multiplexed connection:
+
+        Example:
+            ```python
+            async with AsyncMAIAClient(http2=True) as client:
+                memories = await asyncio.gather(
+                    *(client.get_memory(id) for id in ids)
+                )
+            ```
+        """
         if not id:
             raise ValidationError("id", "id is required")
 
-        data = await self._request("GET", f"/v1/memories/{quote(id, safe='')}")
-        return Memory.model_validate(data)
+        data = await self._get_json(_memory_path(id))
+        return _parse(Memory, data, self._trust_server)
 
     async def update_memory(self, id: str, input: UpdateMemoryInput) -> Memory:
         """Update an existing memory."""
@@ -470,31 +1176,69 @@ class AsyncMAIAClient:
 
         data = await self._request(
             "PUT",
-            f"/v1/memories/{quote(id, safe='')}",
+            _memory_path(id),
             json=input.model_dump(exclude_none=True),
         )
-        return Memory.model_validate(data)
+        memory = _parse(Memory, data, self._trust_server)
+        self._invalidate(
+            _memory_path(id), f"{_namespace_path(memory.namespace)}/memories"
+        )
+        return memory
 
     async def delete_memory(self, id: str) -> None:
         """Delete a memory by ID."""
         if not id:
             raise ValidationError("id", "id is required")
 
-        await self._request("DELETE", f"/v1/memories/{quote(id, safe='')}")
+        await self._request("DELETE", _memory_path(id))
+        # The memory's namespace is unknown here, so every cached namespace
+        # response is dropped along with the memory itself.
+        self._invalidate(_memory_path(id), "/v1/namespaces/", "/v1/stats")
 
     async def search_memories(
         self, input: SearchMemoriesInput | None = None
-    ) -> ListResponse[SearchResult]:
-        """Search for memories."""
+    ) -> SearchListResponse:
+        """Search for memories.
+
+        Example:
+            ```python
+            async with AsyncMAIAClient(http2=True) as client:
+                results = await asyncio.gather(
+                    *(
+                        client.search_memories(SearchMemoriesInput(query=q))
+                        for q in queries
+                    )
+                )
+            ```
+        """
         if input is None:
             input = SearchMemoriesInput()
 
-        data = await self._request(
+        data = await self._post_json("/v1/memories/search", _search_body(input))
+        if not input.include_embeddings:
+            _drop_embeddings(data)
+        return _SEARCH_LIST_ADAPTER.validate_python(data)
+
+    def stream_search_memories(
+        self, input: SearchMemoriesInput | None = None
+    ) -> AsyncIterator[SearchResult]:
+        """Search for memories, yielding results as they arrive.
+
+        Unlike ``search_memories`` the response body is parsed incrementally,
+        so large result sets are never held in memory all at once. Requires
+        the ``ijson`` package (``pip install "maia-sdk[streaming]"``).
+        """
+        if input is None:
+            input = SearchMemoriesInput()
+
+        return self._stream_items(
             "POST",
             "/v1/memories/search",
-            json=input.model_dump(exclude_none=True),
+            # SearchResult nests a Memory, so it is always validated.
+            SearchResult,
+            json=_search_body(input),
+            include_embeddings=bool(input.include_embeddings),
         )
-        return ListResponse[SearchResult].model_validate(data)
 
     # ============== Namespaces ==============
 
@@ -503,11 +1247,11 @@ class AsyncMAIAClient:
         if not input.name:
             raise ValidationError("name", "name is required")
 
-        data = await self._request(
-            "POST",
+        data = await self._post_json(
             "/v1/namespaces",
-            json=input.model_dump(exclude_none=True),
+            input.model_dump(exclude_none=True),
         )
+        self._invalidate("/v1/namespaces", "/v1/stats")
         return Namespace.model_validate(data)
 
     async def get_namespace(self, id_or_name: str) -> Namespace:
@@ -515,9 +1259,7 @@ class AsyncMAIAClient:
         if not id_or_name:
             raise ValidationError("id_or_name", "id or name is required")
 
-        data = await self._request(
-            "GET", f"/v1/namespaces/{quote(id_or_name, safe='')}"
-        )
+        data = await self._get_json(_namespace_path(id_or_name))
         return Namespace.model_validate(data)
 
     async def update_namespace(
@@ -529,9 +1271,10 @@ class AsyncMAIAClient:
 
         data = await self._request(
             "PUT",
-            f"/v1/namespaces/{quote(id, safe='')}",
+            _namespace_path(id),
             json=input.model_dump(exclude_none=True),
         )
+        self._invalidate("/v1/namespaces")
         return Namespace.model_validate(data)
 
     async def delete_namespace(self, id: str) -> None:
@@ -539,42 +1282,55 @@ class AsyncMAIAClient:
         if not id:
             raise ValidationError("id", "id is required")
 
-        await self._request("DELETE", f"/v1/namespaces/{quote(id, safe='')}")
+        await self._request("DELETE", _namespace_path(id))
+        self._invalidate("/v1/namespaces", "/v1/stats")
 
     async def list_namespaces(
         self, options: ListOptions | None = None
-    ) -> ListResponse[Namespace]:
+    ) -> NamespaceListResponse:
         """List all namespaces."""
-        params = {}
-        if options:
-            if options.limit:
-                params["limit"] = options.limit
-            if options.offset:
-                params["offset"] = options.offset
-
-        data = await self._request("GET", "/v1/namespaces", params=params or None)
-        return ListResponse[Namespace].model_validate(data)
+        data = await self._request(
+            "GET", "/v1/namespaces", params=_paginate_params(options)
+        )
+        return _NAMESPACE_LIST_ADAPTER.validate_python(data)
 
     async def list_namespace_memories(
         self, namespace: str, options: ListOptions | None = None
-    ) -> ListResponse[Memory]:
+    ) -> MemoryListResponse:
         """List memories in a namespace."""
         if not namespace:
             raise ValidationError("namespace", "namespace is required")
 
-        params = {}
-        if options:
-            if options.limit:
-                params["limit"] = options.limit
-            if options.offset:
-                params["offset"] = options.offset
-
         data = await self._request(
             "GET",
-            f"/v1/namespaces/{quote(namespace, safe='')}/memories",
-            params=params or None,
+            f"{_namespace_path(namespace)}/memories",
+            params=_memory_list_params(options),
+        )
+        if not (options and options.include_embeddings):
+            _drop_embeddings(data)
+        return _MEMORY_LIST_ADAPTER.validate_python(data)
+
+    def stream_list_namespace_memories(
+        self, namespace: str, options: ListOptions | None = None
+    ) -> AsyncIterator[Memory]:
+        """List memories in a namespace, yielding them as they arrive.
+
+        Unlike ``list_namespace_memories`` the response body is parsed
+        incrementally, so large namespaces are never held in memory all at
+        once. Requires the ``ijson`` package
+        (``pip install "maia-sdk[streaming]"``).
+        """
+        if not namespace:
+            raise ValidationError("namespace", "namespace is required")
+
+        return self._stream_items(
+            "GET",
+            f"{_namespace_path(namespace)}/memories",
+            Memory,
+            params=_memory_list_params(options),
+            include_embeddings=bool(options and options.include_embeddings),
+            trust_server=self._trust_server,
         )
-        return ListResponse[Memory].model_validate(data)
 
     # ============== Context ==============
 
@@ -583,13 +1339,38 @@ class AsyncMAIAClient:
         if not input.query:
             raise ValidationError("query", "query is required")
 
-        data = await self._request(
-            "POST",
+        data = await self._post_json(
             "/v1/context",
-            json=input.model_dump(exclude_none=True),
+            input.model_dump(exclude_none=True),
         )
         return ContextResponse.model_validate(data)
 
+    # ============== Batch ==============
+
+    async def batch(self, calls: list[BatchCall]) -> list[Any]:
+        """Execute several API calls in a single round trip.
+
+        Requires a server that advertises the ``batch`` feature. Returns the
+        decoded body of each call, in order, and raises ``APIError`` for the
+        first call that failed.
+
+        Example:
+            ```python
+            results = await client.batch([
+                BatchCall(method="GET", path="/v1/memories/mem-1"),
+                BatchCall(method="GET", path="/v1/memories/mem-2"),
+            ])
+            ```
+        """
+        if not calls:
+            return []
+
+        data = await self._post_json("/v1/batch", _batch_calls(calls))
+        # Write sub-calls may touch anything, so nothing cached can be trusted.
+        if any(call.method.upper() != "GET" for call in calls):
+            self._invalidate("/")
+        return _batch_results(data)
+
     # ============== Convenience Methods ==============
 
     async def remember(self, namespace: str, content: str) -> Memory:
@@ -600,15 +1381,16 @@ class AsyncMAIAClient:
             memory = await client.remember("default", "User prefers dark mode")
             ```
         """
-        return await self.create_memory(
-            CreateMemoryInput(
-                namespace=namespace,
-                content=content,
-                type=MemoryType.SEMANTIC,
-                source=MemorySource.USER,
-                confidence=1.0,
-            )
+        if not namespace:
+            raise ValidationError("namespace", "namespace is required")
+        if not content:
+            raise ValidationError("content", "content is required")
+
+        data = await self._post_json(
+            _MEMORIES_URL, _remember_payload(namespace, content)
         )
+        self._invalidate(f"{_namespace_path(namespace)}/memories", "/v1/stats")
+        return _parse(Memory, data, self._trust_server)
 
     async def recall(
         self,
@@ -651,3 +1433,159 @@ class AsyncMAIAClient:
             ```
         """
         await self.delete_memory(id)
+
+    async def get_memories(self, ids: list[str]) -> list[Memory]:
+        """Get several memories by ID (convenience method).
+
+        Uses a single batch request when the server supports it and falls back
+        to concurrent per-memory requests otherwise.
+
+        Example:
+            ```python
+            memories = await client.get_memories(["mem-1", "mem-2"])
+            ```
+        """
+        if not ids:
+            return []
+        if not all(ids):
+            raise ValidationError("id", "id is required")
+        if not await self.supports(FEATURE_BATCH):
+            return list(await asyncio.gather(*(self.get_memory(id) for id in ids)))
+
+        results = await self.batch(
+            [BatchCall(method="GET", path=_memory_path(id)) for id in ids]
+        )
+        return [_parse(Memory, r, self._trust_server) for r in results]
+
+    async def remember_many(self, namespace: str, contents: list[str]) -> list[Memory]:
+        """Store several semantic memories (convenience method).
+
+        Uses a single batch request when the server supports it and falls back
+        to concurrent per-memory requests otherwise.
+
+        Example:
+            ```python
+            memories = await client.remember_many("default", ["fact 1", "fact 2"])
+            ```
+        """
+        if not namespace:
+            raise ValidationError("namespace", "namespace is required")
+        if not contents:
+            return []
+        if not all(contents):
+            raise ValidationError("content", "content is required")
+        if not await self.supports(FEATURE_BATCH):
+            return list(
+                await asyncio.gather(
+                    *(self.remember(namespace, content) for content in contents)
+                )
+            )
+
+        results = await self.batch(
+            [
+                BatchCall(
+                    method="POST",
+                    path="/v1/memories",
+                    json=_remember_payload(namespace, content),
+                )
+                for content in contents
+            ]
+        )
+        return [_parse(Memory, r, self._trust_server) for r in results]
+
+
+_default_clients: dict[tuple[Any, ...], AsyncMAIAClient] = {}
+# The loop only keeps weak references to its async generators.
+_default_closers: dict[tuple[Any, ...], AsyncIterator[None]] = {}
+_default_clients_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Turn a client option into something usable as a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _close_with_loop(client: AsyncMAIAClient) -> AsyncIterator[None]:
+    """Wait for the event loop to shut down, then close ``client``.
+
+    ``asyncio.run()`` finalizes pending async generators before closing its
+    loop, so the client's connections are closed on the loop that owns them.
+    """
+    try:
+        yield
+    finally:
+        await client.close()
+
+
+def get_default_async_client(
+    base_url: str = DEFAULT_BASE_URL, **kwargs: Any
+) -> AsyncMAIAClient:
+    """Get a process-wide async client for the given configuration.
+
+    Clients are created lazily and shared by every caller passing the same
+    options, so short-lived code paths (e.g. per-request handlers in a web
+    framework) reuse one connection pool instead of reconnecting each time.
+
+    Connections belong to the event loop they were opened on, so each running
+    loop gets its own clients; call this from inside the coroutine that uses
+    the client. A client is closed when ``asyncio.run()`` shuts its loop
+    down, and any still open are closed at interpreter exit.
+
+    Example:
+        ```python
+        client = get_default_async_client("http://localhost:8080")
+        memory = await client.remember("default", "User prefers dark mode")
+        ```
+    """
+    loop = _running_loop()
+    key = (
+        loop,
+        base_url.rstrip("/"),
+        tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())),
+    )
+    with _default_clients_lock:
+        for stale in [k for k in _default_clients if k[0] and k[0].is_closed()]:
+            del _default_clients[stale]
+            _default_closers.pop(stale, None)
+
+        client = _default_clients.get(key)
+        if client is None or client._client.is_closed:
+            client = AsyncMAIAClient(base_url=base_url, **kwargs)
+            _default_clients[key] = client
+            if loop is not None:
+                closer = _close_with_loop(client)
+                _default_closers[key] = closer
+                # Advance the generator to its yield so the loop tracks it.
+                asyncio.ensure_future(closer.__anext__(), loop=loop)
+        return client
+
+
+@atexit.register
+def _close_default_clients() -> None:
+    with _default_clients_lock:
+        entries = list(_default_clients.items())
+        _default_clients.clear()
+    for (loop, *_), client in entries:
+        if client._client.is_closed:
+            continue
+        # Close on the loop that owns the connections. Clients fetched outside
+        # a loop may never have connected, so any loop will do for them.
+        with contextlib.suppress(Exception):
+            if loop is None:
+                asyncio.run(client.close())
+            elif not loop.is_closed() and not loop.is_running():
+                loop.run_until_complete(client.close())
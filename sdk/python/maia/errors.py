@@ -27,11 +27,19 @@ class APIError(MAIAError):
 
     def is_not_found(self) -> bool:
         """Returns True if the error is a not found error."""
-        return self.status_code == 404 or self.code == "NOT_FOUND"
+        return (
+            isinstance(self, NotFoundError)
+            or self.status_code == 404
+            or self.code == "NOT_FOUND"
+        )
 
     def is_already_exists(self) -> bool:
         """Returns True if the error is an already exists error."""
-        return self.status_code == 409 or self.code == "ALREADY_EXISTS"
+        return (
+            isinstance(self, AlreadyExistsError)
+            or self.status_code == 409
+            or self.code == "ALREADY_EXISTS"
+        )
 
     def is_invalid_input(self) -> bool:
         """Returns True if the error is an invalid input error."""
@@ -66,18 +74,48 @@ class NetworkError(MAIAError):
 
 
 class NotFoundError(APIError):
-    """Error thrown when a resource is not found."""
+    """Error thrown when a resource is not found.
 
-    def __init__(self, resource: str, id: str) -> None:
-        super().__init__(404, f"{resource} not found: {id}", "NOT_FOUND")
+    Raised by the clients for 404 responses, in which case ``message`` and
+    ``details`` come from the server and ``resource``/``id`` are None.
+    """
+
+    def __init__(
+        self,
+        resource: str | None = None,
+        id: str | None = None,
+        *,
+        message: str | None = None,
+        code: str | None = "NOT_FOUND",
+        details: str | None = None,
+    ) -> None:
+        if not message:
+            message = f"{resource} not found: {id}" if resource else "not found"
+        super().__init__(404, message, code, details)
         self.resource = resource
         self.id = id
 
 
 class AlreadyExistsError(APIError):
-    """Error thrown when a resource already exists."""
+    """Error thrown when a resource already exists.
 
-    def __init__(self, resource: str, id: str) -> None:
-        super().__init__(409, f"{resource} already exists: {id}", "ALREADY_EXISTS")
+    Raised by the clients for 409 responses, in which case ``message`` and
+    ``details`` come from the server and ``resource``/``id`` are None.
+    """
+
+    def __init__(
+        self,
+        resource: str | None = None,
+        id: str | None = None,
+        *,
+        message: str | None = None,
+        code: str | None = "ALREADY_EXISTS",
+        details: str | None = None,
+    ) -> None:
+        if not message:
+            message = (
+                f"{resource} already exists: {id}" if resource else "already exists"
+            )
+        super().__init__(409, message, code, details)
         self.resource = resource
         self.id = id
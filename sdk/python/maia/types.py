@@ -1,10 +1,20 @@
 """Type definitions for the MAIA SDK."""
 
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any, Generic, TypeVar
+from typing import Annotated, Any, Generic, Literal, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    ValidatorFunctionWrapHandler,
+    WrapSerializer,
+    WrapValidator,
+)
 
 
 class MemoryType(str, Enum):
@@ -24,6 +34,58 @@ class MemorySource(str, Enum):
     IMPORTED = "imported"
 
 
+EmbeddingEncoding = Literal["json", "fp16_b64", "int8_b64"]
+"""Wire encoding for embeddings sent with ``CreateMemoryInput``.
+
+``json`` sends a list of floats. ``fp16_b64`` sends base64-encoded
+little-endian float16 values, and ``int8_b64`` sends base64-encoded int8
+values plus an ``embedding_scale`` that restores the original magnitude.
+The compact encodings are only used when the server advertises them.
+"""
+
+
+def _is_ndarray(value: Any) -> bool:
+    """Tell whether ``value`` is a NumPy array, without importing NumPy."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _validate_embedding(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Keep NumPy arrays as-is so they can be serialized without a copy."""
+    if not _is_ndarray(value):
+        return handler(value)
+    if value.ndim != 1:
+        raise ValueError("embedding must be a one-dimensional array")
+    np = sys.modules["numpy"]
+    if value.dtype.kind != "f":
+        value = value.astype(np.float32)
+    elif not value.dtype.isnative:
+        # orjson only serializes native-endian arrays.
+        value = value.astype(value.dtype.newbyteorder("="))
+    return np.ascontiguousarray(value)
+
+
+def _serialize_embedding(
+    value: Any, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+) -> Any:
+    """Pass NumPy arrays through ``model_dump`` for orjson to serialize."""
+    if not _is_ndarray(value):
+        return handler(value)
+    return value.tolist() if info.mode_is_json() else value
+
+
+Embedding = Annotated[
+    list[float],
+    WrapValidator(_validate_embedding),
+    WrapSerializer(_serialize_embedding),
+]
+"""An embedding vector: a list of floats, or a one-dimensional NumPy array.
+
+Arrays are kept as-is and serialized by orjson, which avoids formatting
+each float in Python for large vectors.
+"""
+
+
 class Memory(BaseModel):
     """A single memory unit stored in MAIA."""
 
@@ -68,9 +130,13 @@ class Namespace(BaseModel):
 class CreateMemoryInput(BaseModel):
     """Input for creating a new memory."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     namespace: str
     content: str
     type: MemoryType | None = None
+    embedding: Embedding | None = None
+    embedding_encoding: EmbeddingEncoding = "json"
     metadata: dict[str, Any] | None = None
     tags: list[str] | None = None
     confidence: float | None = None
@@ -89,12 +155,15 @@ class UpdateMemoryInput(BaseModel):
 class SearchMemoriesInput(BaseModel):
     """Input for searching memories."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     query: str | None = None
     namespace: str | None = None
     types: list[MemoryType] | None = None
     tags: list[str] | None = None
     limit: int | None = None
     offset: int | None = None
+    include_embeddings: bool | None = None
 
 
 class SearchResult(BaseModel):
@@ -124,6 +193,7 @@ class ListOptions(BaseModel):
 
     limit: int | None = None
     offset: int | None = None
+    include_embeddings: bool | None = None
 
 
 T = TypeVar("T")
@@ -138,6 +208,18 @@ class ListResponse(BaseModel, Generic[T]):
     limit: int
 
 
+class MemoryListResponse(ListResponse[Memory]):
+    """A paginated list of memories."""
+
+
+class SearchListResponse(ListResponse[SearchResult]):
+    """A paginated list of memory search results."""
+
+
+class NamespaceListResponse(ListResponse[Namespace]):
+    """A paginated list of namespaces."""
+
+
 class GetContextInput(BaseModel):
     """Input for getting assembled context."""
 
@@ -198,6 +280,35 @@ class HealthResponse(BaseModel):
 
     status: str
     service: str
+    features: list[str] | None = None
+
+
+class BatchCall(BaseModel):
+    """A single API call executed as part of a batch.
+
+    ``input_from`` is the index of an earlier call in the same batch whose
+    result this call consumes, or -1 if the call is independent.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    method: str
+    path: str
+    body: Any | None = Field(default=None, alias="json")
+    input_from: int = -1
+
+
+class BatchResult(BaseModel):
+    """The outcome of a single call in a batch."""
+
+    status: int
+    body: Any | None = None
+
+
+class BatchResponse(BaseModel):
+    """Batch operation response."""
+
+    results: list[BatchResult]
 
 
 class DeleteResponse(BaseModel):
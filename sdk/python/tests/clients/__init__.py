@@ -0,0 +1 @@
+"""Tests for the MAIA SDK clients, run against mocked HTTP servers."""
@@ -0,0 +1,129 @@
+"""Shared fixtures for the MAIA SDK client tests.
+
+They live here rather than in ``tests/conftest.py`` so the pure unit tests
+outside this package never import httpx, respx or the clients.
+"""
+
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+import respx
+
+from maia import AsyncMAIAClient, MAIAClient
+
+BASE_URL = "http://localhost:8080"
+
+Routes = dict[tuple[str, str], httpx.Response]
+
+# Every make_transport transport reports this memory as missing.
+_MISSING_MEMORY_PATH = "/v1/memories/nonexistent"
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_NOT_FOUND_BYTES = orjson.dumps({"error": "memory not found", "code": "NOT_FOUND"})
+
+
+def _make_transport(
+    routes: Routes, requests: list[httpx.Request] | None = None
+) -> httpx.MockTransport:
+    """Build a transport that answers from a ``(method, path)`` table.
+
+    Requests are appended to ``requests`` when given. Each call gets a fresh
+    copy of the routed response, so one entry can answer repeated requests.
+    The ``nonexistent`` memory gets a 404 without needing a route.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        if request.url.path == _MISSING_MEMORY_PATH:
+            return httpx.Response(404, content=_NOT_FOUND_BYTES, headers=_JSON_HEADERS)
+        response = routes[(request.method, request.url.path)]
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.content
+        )
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def make_transport() -> Callable[..., httpx.MockTransport]:
+    """Factory for clients that need their own transport instead of respx."""
+    return _make_transport
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_sdk() -> None:
+    """Pay one-off SDK setup before the first test of each worker runs.
+
+    Pydantic builds the model schemas when ``maia`` is imported; building a
+    throwaway client also loads httpx's transport and SSL setup, so neither
+    is charged to whichever test happens to run first.
+    """
+    MAIAClient(base_url=BASE_URL).close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def respx_session() -> Iterator[respx.MockRouter]:
+    """A respx router kept active for the whole session.
+
+    Test modules register the routes they share on it once; routes that are
+    never hit are fine.
+    """
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture
+def respx_mock(respx_session: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """The session router, with routes added or changed by a test rolled back.
+
+    Overrides respx's own fixture so per-test routes don't have to compete
+    with the session router for requests.
+    """
+    respx_session.snapshot()
+    yield respx_session
+    respx_session.rollback()
+
+
+# Shared clients live for one test class. pytest-xdist runs with
+# --dist=loadscope, which keeps every test of a class on the same worker, so
+# each class builds its clients once and reuses their connection pools.
+@pytest.fixture(scope="class")
+def _class_client() -> Iterator[MAIAClient]:
+    """A MAIAClient shared by every test in a class."""
+    with MAIAClient(base_url=BASE_URL) as client:
+        yield client
+
+
+@pytest.fixture
+def client(_class_client: MAIAClient) -> MAIAClient:
+    """The shared MAIAClient, with per-test state reset."""
+    # Tests mock different health responses, so forget advertised features.
+    _class_client._features = None
+    return _class_client
+
+
+# Async tests using it must run on the class-scoped event loop as well.
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def _class_async_client() -> AsyncIterator[AsyncMAIAClient]:
+    """An AsyncMAIAClient shared by every test in a class."""
+    async with AsyncMAIAClient(base_url=BASE_URL) as client:
+        yield client
+
+
+@pytest.fixture
+def async_client(_class_async_client: AsyncMAIAClient) -> AsyncMAIAClient:
+    """The shared AsyncMAIAClient, with per-test state reset."""
+    _class_async_client._features = None
+    return _class_async_client
+
+
+@pytest.fixture(params=["sync", "async"])
+def any_client(request: pytest.FixtureRequest) -> MAIAClient | AsyncMAIAClient:
+    """Each client in turn, for behaviour the two clients share."""
+    return request.getfixturevalue(
+        "client" if request.param == "sync" else "async_client"
+    )
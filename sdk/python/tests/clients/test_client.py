@@ -0,0 +1,1213 @@
+"""Tests for the MAIA SDK client."""
+
+import asyncio
+import base64
+import inspect
+import json
+import struct
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import httpx
+import orjson
+import pydantic
+import pytest
+import respx
+from httpx import Response
+
+from maia import (
+    MAIAClient,
+    AsyncMAIAClient,
+    CreateMemoryInput,
+    UpdateMemoryInput,
+    SearchMemoriesInput,
+    CreateNamespaceInput,
+    UpdateNamespaceInput,
+    GetContextInput,
+    BatchCall,
+    ListOptions,
+    NamespaceConfig,
+    MemoryType,
+    MemorySource,
+    APIError,
+    AlreadyExistsError,
+    NotFoundError,
+    ValidationError,
+    get_default_async_client,
+)
+
+
+BASE_URL = "http://localhost:8080"
+
+_URL_HEALTH = httpx.URL(f"{BASE_URL}/health")
+_URL_STATS = httpx.URL(f"{BASE_URL}/v1/stats")
+_URL_MEMORIES = httpx.URL(f"{BASE_URL}/v1/memories")
+_URL_MEMORY = httpx.URL(f"{BASE_URL}/v1/memories/mem-123")
+_URL_SEARCH = httpx.URL(f"{BASE_URL}/v1/memories/search")
+_URL_NAMESPACES = httpx.URL(f"{BASE_URL}/v1/namespaces")
+_URL_NAMESPACE = httpx.URL(f"{BASE_URL}/v1/namespaces/test-namespace")
+_URL_NAMESPACE_MEMORIES = httpx.URL(f"{BASE_URL}/v1/namespaces/test/memories")
+_URL_MISSING_NAMESPACE_MEMORIES = httpx.URL(
+    f"{BASE_URL}/v1/namespaces/missing/memories"
+)
+_URL_CONTEXT = httpx.URL(f"{BASE_URL}/v1/context")
+_URL_BATCH = httpx.URL(f"{BASE_URL}/v1/batch")
+
+
+_MEMORY_FIXTURE = {
+    "id": "mem-123",
+    "namespace": "test",
+    "content": "Test memory",
+    "type": "semantic",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "accessed_at": "2024-01-01T00:00:00Z",
+    "access_count": 0,
+    "confidence": 1.0,
+    "source": "user",
+}
+
+_NAMESPACE_FIXTURE = {
+    "id": "ns-123",
+    "name": "test-namespace",
+    "config": {},
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+_CONTEXT_FIXTURE = {
+    "content": "User likes coffee",
+    "memories": [],
+    "token_count": 5,
+    "token_budget": 1000,
+    "truncated": False,
+    "query_time": "1ms",
+}
+
+
+def _mk_create(**overrides: Any) -> CreateMemoryInput:
+    """Build a CreateMemoryInput without validation, for plumbing tests.
+
+    Tests of input validation itself should build ``CreateMemoryInput``
+    directly.
+    """
+    fields = {
+        "namespace": "test",
+        "content": "Test memory",
+        "type": MemoryType.SEMANTIC,
+        **overrides,
+    }
+    return CreateMemoryInput.model_construct(**fields)
+
+
+async def _maybe_await(value: Any) -> Any:
+    """Await ``value`` if it came from the async client."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def _memory(**overrides: Any) -> dict[str, Any]:
+    """Build a memory response body."""
+    return {**_MEMORY_FIXTURE, **overrides}
+
+
+def _namespace(**overrides: Any) -> dict[str, Any]:
+    """Build a namespace response body."""
+    return {**_NAMESPACE_FIXTURE, **overrides}
+
+
+def _context(**overrides: Any) -> dict[str, Any]:
+    """Build a context response body."""
+    return {**_CONTEXT_FIXTURE, **overrides}
+
+
+_HEALTH_FIXTURE = {"status": "healthy", "service": "maia"}
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+# Bodies of the canonical fixtures, serialized once at import.
+_HEALTH_BYTES = orjson.dumps(_HEALTH_FIXTURE)
+_MEMORY_BYTES = orjson.dumps(_MEMORY_FIXTURE)
+_NAMESPACE_BYTES = orjson.dumps(_NAMESPACE_FIXTURE)
+_CONTEXT_BYTES = orjson.dumps(_CONTEXT_FIXTURE)
+_DELETED_BYTES = orjson.dumps({"deleted": True})
+
+
+def _resp(content: bytes, status: int = 200) -> Response:
+    """Build a JSON response from an already serialized body."""
+    return Response(status, content=content, headers=_JSON_HEADERS)
+
+
+def _json_response(status: int, payload: Any) -> Response:
+    """Build a JSON response, serialized with orjson."""
+    return _resp(orjson.dumps(payload), status)
+
+
+def _health(*features: str) -> Response:
+    """Build a health response advertising ``features``."""
+    return _json_response(200, {**_HEALTH_FIXTURE, "features": list(features)})
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _default_routes(respx_session: respx.MockRouter) -> Iterator[None]:
+    """Register the routes most tests share, once per module."""
+    respx_session.snapshot()
+    respx_session.get(_URL_HEALTH, name="health").mock(
+        return_value=_resp(_HEALTH_BYTES)
+    )
+    respx_session.post(_URL_MEMORIES, name="create_memory").mock(
+        return_value=_resp(_MEMORY_BYTES, 201)
+    )
+    respx_session.post(_URL_CONTEXT, name="context").mock(
+        return_value=_resp(_CONTEXT_BYTES)
+    )
+    yield
+    respx_session.rollback()
+
+
+class TestMAIAClient:
+    """Tests for the synchronous MAIA client."""
+
+    def test_stats(self, client: MAIAClient, respx_mock: respx.MockRouter) -> None:
+        """Test stats."""
+        respx_mock.get(_URL_STATS).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "total_memories": 100,
+                    "total_namespaces": 5,
+                    "storage_size_bytes": 1024,
+                    "last_compaction": "2024-01-01T00:00:00Z",
+                },
+            )
+        )
+
+        response = client.stats()
+
+        assert response.total_memories == 100
+        assert response.total_namespaces == 5
+
+    def test_create_memory_fp16_embedding(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test sending an embedding as base64 float16."""
+        respx_mock.get(_URL_HEALTH).mock(return_value=_health("embedding_fp16_b64"))
+        route = respx_mock["create_memory"]
+
+        client.create_memory(
+            _mk_create(embedding=[0.5, -1.0, 2.0], embedding_encoding="fp16_b64")
+        )
+
+        body = json.loads(route.calls[0].request.content)
+        raw = base64.b64decode(body["embedding"])
+        assert body["embedding_encoding"] == "fp16_b64"
+        assert struct.unpack("<3e", raw) == (0.5, -1.0, 2.0)
+
+    def test_create_memory_int8_embedding(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test sending an embedding as base64 int8 with a scale."""
+        respx_mock.get(_URL_HEALTH).mock(return_value=_health("embedding_int8_b64"))
+        route = respx_mock["create_memory"]
+        embedding = [0.5, -1.0, 2.0, 0.01]
+
+        client.create_memory(
+            _mk_create(embedding=embedding, embedding_encoding="int8_b64")
+        )
+
+        body = json.loads(route.calls[0].request.content)
+        scale = body["embedding_scale"]
+        raw = base64.b64decode(body["embedding"])
+        assert body["embedding_encoding"] == "int8_b64"
+        assert scale == 2.0 / 127
+        assert struct.unpack("<4b", raw) == tuple(round(v / scale) for v in embedding)
+
+    @pytest.mark.parametrize(
+        "embedding",
+        [
+            pytest.param([5e-324, 0.0], id="scale-underflow"),
+            pytest.param([1e-310, -5e-311], id="subnormal"),
+        ],
+    )
+    def test_create_memory_int8_embedding_tiny(
+        self,
+        client: MAIAClient,
+        respx_mock: respx.MockRouter,
+        embedding: list[float],
+    ) -> None:
+        """Test int8 encoding of vectors whose scale underflows."""
+        np = pytest.importorskip("numpy")
+        respx_mock.get(_URL_HEALTH).mock(return_value=_health("embedding_int8_b64"))
+        route = respx_mock["create_memory"]
+
+        client.create_memory(
+            _mk_create(embedding=embedding, embedding_encoding="int8_b64")
+        )
+        client.create_memory(
+            _mk_create(embedding=np.array(embedding), embedding_encoding="int8_b64")
+        )
+
+        from_list, from_array = (json.loads(c.request.content) for c in route.calls)
+        scale = from_list["embedding_scale"]
+        raw = base64.b64decode(from_list["embedding"])
+        assert scale > 0
+        assert struct.unpack("<2b", raw) == tuple(round(v / scale) for v in embedding)
+        assert from_array == from_list
+
+    @pytest.mark.parametrize(
+        "encoding,value",
+        [
+            pytest.param("fp16_b64", 1e5, id="fp16-overflow"),
+            pytest.param("fp16_b64", float("inf"), id="fp16-inf"),
+            pytest.param("int8_b64", float("nan"), id="int8-nan"),
+            pytest.param("int8_b64", float("inf"), id="int8-inf"),
+        ],
+    )
+    def test_create_memory_embedding_unencodable(
+        self,
+        client: MAIAClient,
+        respx_mock: respx.MockRouter,
+        encoding: str,
+        value: float,
+    ) -> None:
+        """Test that values the encoding can't represent raise ValidationError."""
+        respx_mock.get(_URL_HEALTH).mock(
+            return_value=_health("embedding_fp16_b64", "embedding_int8_b64")
+        )
+
+        with pytest.raises(ValidationError) as exc_info:
+            client.create_memory(
+                _mk_create(embedding=[0.5, value], embedding_encoding=encoding)
+            )
+
+        assert exc_info.value.field == "embedding"
+        assert not respx_mock["create_memory"].called
+
+    def test_create_memory_numpy_embedding(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test sending a NumPy array embedding as JSON floats."""
+        np = pytest.importorskip("numpy")
+        route = respx_mock["create_memory"]
+
+        input = CreateMemoryInput(
+            namespace="test",
+            content="Test memory",
+            embedding=np.array([0.5, -1.0, 2.0], dtype=np.float32),
+        )
+        assert isinstance(input.embedding, np.ndarray)
+
+        client.create_memory(input)
+
+        body = json.loads(route.calls[0].request.content)
+        assert body["embedding"] == [0.5, -1.0, 2.0]
+        assert input.model_dump_json(include={"embedding"}) == (
+            '{"embedding":[0.5,-1.0,2.0]}'
+        )
+
+    @pytest.mark.parametrize("dtype", ["=f4", ">f4"])
+    @pytest.mark.parametrize("encoding", ["json", "fp16_b64", "int8_b64"])
+    def test_create_memory_numpy_embedding_encoded(
+        self,
+        client: MAIAClient,
+        respx_mock: respx.MockRouter,
+        encoding: str,
+        dtype: str,
+    ) -> None:
+        """Test that NumPy and list embeddings encode to the same body."""
+        np = pytest.importorskip("numpy")
+        respx_mock.get(_URL_HEALTH).mock(
+            return_value=_health("embedding_fp16_b64", "embedding_int8_b64")
+        )
+        route = respx_mock["create_memory"]
+        embedding = [0.5, -1.0, 2.0, 0.25, -0.125, 3.0, 0.0078125]
+
+        client.create_memory(
+            _mk_create(embedding=embedding, embedding_encoding=encoding)
+        )
+        client.create_memory(
+            CreateMemoryInput(
+                namespace="test",
+                content="Test memory",
+                type=MemoryType.SEMANTIC,
+                embedding=np.array(embedding, dtype=dtype),
+                embedding_encoding=encoding,
+            )
+        )
+
+        from_list, from_array = (json.loads(c.request.content) for c in route.calls)
+        assert from_array == from_list
+
+    @pytest.mark.parametrize(
+        "encoding,value",
+        [
+            pytest.param("fp16_b64", 1e5, id="fp16-overflow"),
+            pytest.param("int8_b64", float("nan"), id="int8-nan"),
+        ],
+    )
+    def test_create_memory_numpy_embedding_unencodable(
+        self,
+        client: MAIAClient,
+        respx_mock: respx.MockRouter,
+        encoding: str,
+        value: float,
+    ) -> None:
+        """Test that NumPy embeddings are range-checked like lists."""
+        np = pytest.importorskip("numpy")
+        respx_mock.get(_URL_HEALTH).mock(
+            return_value=_health("embedding_fp16_b64", "embedding_int8_b64")
+        )
+
+        with pytest.raises(ValidationError) as exc_info:
+            client.create_memory(
+                _mk_create(
+                    embedding=np.array([0.5, value], dtype=np.float32),
+                    embedding_encoding=encoding,
+                )
+            )
+
+        assert exc_info.value.field == "embedding"
+
+    def test_create_memory_embedding_encoding_unsupported(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test falling back to JSON floats when the server lacks support."""
+        route = respx_mock["create_memory"]
+
+        client.create_memory(
+            _mk_create(embedding=[0.5, -1.0], embedding_encoding="int8_b64")
+        )
+
+        body = json.loads(route.calls[0].request.content)
+        assert body["embedding"] == [0.5, -1.0]
+        assert "embedding_encoding" not in body
+
+    @pytest.mark.parametrize(
+        "call,field",
+        [
+            pytest.param(
+                lambda c: c.create_memory(CreateMemoryInput(namespace="", content="x")),
+                "namespace",
+                id="create_memory-namespace",
+            ),
+            pytest.param(
+                lambda c: c.create_memory(CreateMemoryInput(namespace="x", content="")),
+                "content",
+                id="create_memory-content",
+            ),
+            pytest.param(lambda c: c.get_memory(""), "id", id="get_memory-id"),
+            pytest.param(
+                lambda c: c.get_context(GetContextInput(query="")),
+                "query",
+                id="get_context-query",
+            ),
+        ],
+    )
+    def test_validation_error(
+        self, client: MAIAClient, call: Callable[[MAIAClient], object], field: str
+    ) -> None:
+        """Test validation errors for missing required fields."""
+        with pytest.raises(ValidationError) as exc_info:
+            call(client)
+        assert exc_info.value.field == field
+
+    def test_get_memory(self, client: MAIAClient, respx_mock: respx.MockRouter) -> None:
+        """Test getting a memory."""
+        respx_mock.get(_URL_MEMORY).mock(return_value=_resp(_MEMORY_BYTES))
+
+        memory = client.get_memory("mem-123")
+
+        assert memory.id == "mem-123"
+        assert memory.type is MemoryType.SEMANTIC
+        assert memory.source is MemorySource.USER
+
+    @pytest.mark.parametrize(
+        "id_,raw_path",
+        [
+            pytest.param(
+                "0b7e4c1a-9f2d-4e8b-a6c3-5d1f2e3a4b5c",
+                b"/v1/memories/0b7e4c1a-9f2d-4e8b-a6c3-5d1f2e3a4b5c",
+                id="uuid",
+            ),
+            pytest.param("a/b c", b"/v1/memories/a%2Fb%20c", id="quoted"),
+        ],
+    )
+    def test_get_memory_path_escaping(
+        self,
+        make_transport: Callable[..., httpx.MockTransport],
+        id_: str,
+        raw_path: bytes,
+    ) -> None:
+        """Test that IDs are percent-encoded only when they need it."""
+        requests: list[httpx.Request] = []
+        path = f"/v1/memories/{id_}"
+        transport = make_transport({("GET", path): _resp(_MEMORY_BYTES)}, requests)
+
+        client = MAIAClient(base_url=BASE_URL, transport=transport)
+        client.get_memory(id_)
+
+        assert requests[0].url.raw_path == raw_path
+
+    def test_get_memory_trust_server(
+        self, make_transport: Callable[..., httpx.MockTransport]
+    ) -> None:
+        """Test getting a memory without validating the response."""
+        transport = make_transport({("GET", _URL_MEMORY.path): _resp(_MEMORY_BYTES)})
+
+        client = MAIAClient(base_url=BASE_URL, trust_server=True, transport=transport)
+        memory = client.get_memory("mem-123")
+
+        assert memory.id == "mem-123"
+        assert memory.created_at == "2024-01-01T00:00:00Z"
+
+    def test_get_memory_not_found(
+        self, make_transport: Callable[..., httpx.MockTransport]
+    ) -> None:
+        """Test getting a non-existent memory."""
+        client = MAIAClient(base_url=BASE_URL, transport=make_transport({}))
+
+        with pytest.raises(NotFoundError) as exc_info:
+            client.get_memory("nonexistent")
+
+        assert exc_info.value.is_not_found()
+        assert exc_info.value.message == "memory not found"
+
+    def test_server_error_without_json(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test an error response whose body is not JSON."""
+        respx_mock.get(_URL_STATS).mock(return_value=Response(502, text="Bad Gateway"))
+
+        with pytest.raises(APIError) as exc_info:
+            client.stats()
+
+        assert exc_info.value.is_server_error()
+        assert exc_info.value.message == "Bad Gateway"
+
+    @pytest.mark.parametrize(
+        "response,error_cls,message",
+        [
+            pytest.param(Response(404), NotFoundError, "HTTP 404", id="404-empty"),
+            pytest.param(
+                Response(404, text="404 page not found"),
+                NotFoundError,
+                "404 page not found",
+                id="404-text",
+            ),
+            pytest.param(
+                Response(409, text="conflict"),
+                AlreadyExistsError,
+                "conflict",
+                id="409-text",
+            ),
+        ],
+    )
+    def test_error_without_json_body(
+        self,
+        client: MAIAClient,
+        respx_mock: respx.MockRouter,
+        response: Response,
+        error_cls: type[APIError],
+        message: str,
+    ) -> None:
+        """Test that non-JSON 404 and 409 bodies still raise specific errors."""
+        respx_mock.delete(_URL_MEMORY).mock(return_value=response)
+
+        with pytest.raises(error_cls) as exc_info:
+            client.delete_memory("mem-123")
+
+        assert exc_info.value.message == message
+
+    @pytest.mark.parametrize(
+        "payload,status,error_cls,message",
+        [
+            pytest.param(
+                {"error": "conflict", "code": "VERSION_CONFLICT"},
+                409,
+                APIError,
+                "conflict",
+                id="409-other_code",
+            ),
+            pytest.param(
+                {"error": "exists", "code": "ALREADY_EXISTS"},
+                409,
+                AlreadyExistsError,
+                "exists",
+                id="409-already_exists",
+            ),
+            pytest.param(
+                {"error": None}, 404, NotFoundError, "HTTP 404", id="404-null"
+            ),
+            pytest.param(
+                {"error": ""}, 409, AlreadyExistsError, "HTTP 409", id="409-empty"
+            ),
+        ],
+    )
+    def test_error_class_mapping(
+        self,
+        client: MAIAClient,
+        respx_mock: respx.MockRouter,
+        payload: dict[str, Any],
+        status: int,
+        error_cls: type[APIError],
+        message: str,
+    ) -> None:
+        """Test that 404 and 409 map to specific errors only for their codes."""
+        respx_mock.delete(_URL_MEMORY).mock(
+            return_value=_json_response(status, payload)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client.delete_memory("mem-123")
+
+        assert type(exc_info.value) is error_cls
+        assert exc_info.value.message == message
+
+    def test_get_memory_cached(
+        self, make_transport: Callable[..., httpx.MockTransport]
+    ) -> None:
+        """Test that cached GETs are served locally until a write."""
+        requests: list[httpx.Request] = []
+        transport = make_transport(
+            {
+                ("GET", _URL_MEMORY.path): _resp(_MEMORY_BYTES),
+                ("PUT", _URL_MEMORY.path): _json_response(
+                    200, _memory(content="Updated")
+                ),
+            },
+            requests,
+        )
+
+        client = MAIAClient(base_url=BASE_URL, cache_size=16, transport=transport)
+        client.get_memory("mem-123")
+        client.get_memory("mem-123")
+        assert [r.method for r in requests] == ["GET"]
+
+        client.update_memory("mem-123", UpdateMemoryInput(content="Updated"))
+        client.get_memory("mem-123")
+        assert [r.method for r in requests] == ["GET", "PUT", "GET"]
+
+    def test_ready_not_cached(
+        self, make_transport: Callable[..., httpx.MockTransport]
+    ) -> None:
+        """Test that readiness checks always reach the server."""
+        requests: list[httpx.Request] = []
+        transport = make_transport({("GET", "/ready"): Response(200)}, requests)
+
+        client = MAIAClient(base_url=BASE_URL, cache_size=16, transport=transport)
+        client.ready()
+        client.ready()
+
+        assert len(requests) == 2
+
+    def test_update_memory(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test updating a memory."""
+        respx_mock.put(_URL_MEMORY).mock(
+            return_value=_json_response(200, _memory(content="Updated content"))
+        )
+
+        memory = client.update_memory(
+            "mem-123", UpdateMemoryInput(content="Updated content")
+        )
+
+        assert memory.content == "Updated content"
+
+    def test_delete_memory(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test deleting a memory."""
+        respx_mock.delete(_URL_MEMORY).mock(return_value=_resp(_DELETED_BYTES))
+
+        client.delete_memory("mem-123")  # Should not raise
+
+    def test_search_memories(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test searching memories."""
+        respx_mock.post(_URL_SEARCH).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "data": [
+                        {
+                            "memory": _memory(id="mem-1", content="Result 1"),
+                            "score": 0.9,
+                        }
+                    ],
+                    "count": 1,
+                    "offset": 0,
+                    "limit": 100,
+                },
+            )
+        )
+
+        results = client.search_memories(
+            SearchMemoriesInput(query="test", namespace="test")
+        )
+
+        assert len(results.data) == 1
+        assert results.data[0].memory.id == "mem-1"
+
+    def test_stream_search_memories(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test streaming search results."""
+        respx_mock.post(_URL_SEARCH).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "data": [
+                        {
+                            "memory": _memory(
+                                id=f"mem-{i}",
+                                content=f"Result {i}",
+                                embedding=[0.1, 0.2],
+                            ),
+                            "score": 0.9,
+                        }
+                        for i in range(3)
+                    ],
+                    "count": 3,
+                    "offset": 0,
+                    "limit": 100,
+                },
+            )
+        )
+
+        results = list(
+            client.stream_search_memories(
+                SearchMemoriesInput(query="test", include_embeddings=True)
+            )
+        )
+
+        assert [r.memory.id for r in results] == ["mem-0", "mem-1", "mem-2"]
+        assert results[0].memory.embedding == [0.1, 0.2]
+
+    def test_stream_search_memories_trust_server(
+        self, make_transport: Callable[..., httpx.MockTransport]
+    ) -> None:
+        """Test that streamed search results nest a real Memory when trusted."""
+        transport = make_transport(
+            {
+                ("POST", _URL_SEARCH.path): _json_response(
+                    200,
+                    {
+                        "data": [{"memory": _memory(), "score": 0.9}],
+                        "count": 1,
+                        "offset": 0,
+                        "limit": 100,
+                    },
+                )
+            }
+        )
+
+        client = MAIAClient(base_url=BASE_URL, trust_server=True, transport=transport)
+        results = list(client.stream_search_memories(SearchMemoriesInput(query="t")))
+
+        assert results[0].memory.id == "mem-123"
+        assert results[0].memory.type == MemoryType.SEMANTIC
+
+    def test_stream_list_namespace_memories_not_found(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test streaming memories from a missing namespace."""
+        respx_mock.get(_URL_MISSING_NAMESPACE_MEMORIES).mock(
+            return_value=_json_response(
+                404, {"error": "namespace not found", "code": "NOT_FOUND"}
+            )
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            list(client.stream_list_namespace_memories("missing"))
+
+        assert exc_info.value.is_not_found()
+
+    def test_create_namespace(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test creating a namespace."""
+        respx_mock.post(_URL_NAMESPACES).mock(
+            return_value=_json_response(201, _namespace(config={"token_budget": 4000}))
+        )
+
+        ns = client.create_namespace(
+            CreateNamespaceInput(
+                name="test-namespace", config=NamespaceConfig(token_budget=4000)
+            )
+        )
+
+        assert ns.id == "ns-123"
+        assert ns.name == "test-namespace"
+
+    def test_get_namespace(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test getting a namespace."""
+        respx_mock.get(_URL_NAMESPACE).mock(return_value=_resp(_NAMESPACE_BYTES))
+
+        ns = client.get_namespace("test-namespace")
+
+        assert ns.id == "ns-123"
+
+    def test_list_namespaces(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test listing namespaces."""
+        route = respx_mock.get(_URL_NAMESPACES).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "data": [_namespace(id="ns-1", name="namespace-1")],
+                    "count": 1,
+                    "offset": 0,
+                    "limit": 100,
+                },
+            )
+        )
+
+        results = client.list_namespaces(ListOptions(limit=10))
+
+        assert len(results.data) == 1
+        assert dict(route.calls[0].request.url.params) == {"limit": "10"}
+
+    def test_list_namespace_memories_drops_embeddings(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test that embeddings are dropped from list results by default."""
+        route = respx_mock.get(_URL_NAMESPACE_MEMORIES).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "data": [_memory(embedding=[0.1, 0.2, 0.3])],
+                    "count": 1,
+                    "offset": 0,
+                    "limit": 100,
+                },
+            )
+        )
+
+        results = client.list_namespace_memories("test")
+
+        assert results.data[0].embedding is None
+        assert route.calls[0].request.url.params["include_embeddings"] == "false"
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            pytest.param(Response(200), id="empty"),
+            pytest.param(_json_response(200, []), id="array"),
+        ],
+    )
+    def test_list_namespace_memories_malformed_body(
+        self, client: MAIAClient, respx_mock: respx.MockRouter, response: Response
+    ) -> None:
+        """Test that a non-object list body fails validation cleanly."""
+        respx_mock.get(_URL_NAMESPACE_MEMORIES).mock(return_value=response)
+
+        with pytest.raises(pydantic.ValidationError):
+            client.list_namespace_memories("test")
+
+    def test_get_context(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test getting context."""
+        respx_mock.post(_URL_CONTEXT).mock(
+            return_value=_json_response(
+                200,
+                _context(
+                    content="User prefers dark mode.", token_count=10, token_budget=2000
+                ),
+            )
+        )
+
+        response = client.get_context(
+            GetContextInput(query="What are the user preferences?", namespace="default")
+        )
+
+        assert response.content == "User prefers dark mode."
+
+    def test_forget(self, client: MAIAClient, respx_mock: respx.MockRouter) -> None:
+        """Test forget convenience method."""
+        respx_mock.delete(_URL_MEMORY).mock(return_value=_resp(_DELETED_BYTES))
+
+        client.forget("mem-123")  # Should not raise
+
+    def test_batch(self, client: MAIAClient, respx_mock: respx.MockRouter) -> None:
+        """Test executing a batch of calls."""
+        route = respx_mock.post(_URL_BATCH).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "results": [
+                        {
+                            "status": 200,
+                            "body": {"status": "healthy", "service": "maia"},
+                        },
+                        {"status": 200, "body": {"deleted": True}},
+                    ]
+                },
+            )
+        )
+
+        results = client.batch(
+            [
+                BatchCall(method="GET", path="/health"),
+                BatchCall(method="DELETE", path="/v1/memories/mem-123"),
+            ]
+        )
+
+        assert results == [{"status": "healthy", "service": "maia"}, {"deleted": True}]
+        assert route.calls[0].request.headers["content-type"] == "application/json"
+        assert json.loads(route.calls[0].request.content) == {
+            "calls": [
+                {"method": "GET", "path": "/health", "input_from": -1},
+                {"method": "DELETE", "path": "/v1/memories/mem-123", "input_from": -1},
+            ]
+        }
+
+    def test_batch_error(
+        self, client: MAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test a failed call inside a batch."""
+        respx_mock.post(_URL_BATCH).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "results": [
+                        {
+                            "status": 404,
+                            "body": {"error": "memory not found", "code": "NOT_FOUND"},
+                        }
+                    ]
+                },
+            )
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client.batch([BatchCall(method="GET", path="/v1/memories/nonexistent")])
+
+        assert exc_info.value.is_not_found()
+
+    def test_get_memories_batch_keeps_cache(
+        self, make_transport: Callable[..., httpx.MockTransport]
+    ) -> None:
+        """Test that a read-only batch leaves cached responses in place."""
+        requests: list[httpx.Request] = []
+        transport = make_transport(
+            {
+                ("GET", "/health"): _health("batch"),
+                ("GET", _URL_MEMORY.path): _resp(_MEMORY_BYTES),
+                ("POST", "/v1/batch"): _json_response(
+                    200, {"results": [{"status": 200, "body": _memory()}]}
+                ),
+            },
+            requests,
+        )
+
+        client = MAIAClient(base_url=BASE_URL, cache_size=16, transport=transport)
+        client.get_memory("mem-123")
+        client.get_memories(["mem-123"])
+        client.get_memory("mem-123")
+
+        assert [r.url.path for r in requests] == [
+            _URL_MEMORY.path,
+            "/health",
+            "/v1/batch",
+        ]
+
+    def test_context_manager(self) -> None:
+        """Test using client as context manager."""
+        with MAIAClient(base_url=BASE_URL) as client:
+            assert client is not None
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestAsyncMAIAClient:
+    """Tests for the asynchronous MAIA client."""
+
+    async def test_stream_list_namespace_memories(
+        self, async_client: AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test streaming memories in a namespace."""
+        respx_mock.get(_URL_NAMESPACE_MEMORIES).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "data": [_memory()],
+                    "count": 1,
+                    "offset": 0,
+                    "limit": 100,
+                },
+            )
+        )
+
+        memories = [
+            m async for m in async_client.stream_list_namespace_memories("test")
+        ]
+
+        assert [m.id for m in memories] == ["mem-123"]
+
+    async def test_get_namespace_single_flight(
+        self, async_client: AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test that concurrent identical GETs share one request."""
+        route = respx_mock.get(_URL_NAMESPACE).mock(
+            return_value=_resp(_NAMESPACE_BYTES)
+        )
+
+        first, second = await asyncio.gather(
+            async_client.get_namespace("test-namespace"),
+            async_client.get_namespace("test-namespace"),
+        )
+
+        assert not async_client._inflight
+        assert first.name == second.name == "test-namespace"
+        assert first is not second
+        assert route.call_count == 1
+
+    async def test_get_memory_cache_skips_stale_response(self) -> None:
+        """Test that a GET sent before a write completes is not cached."""
+        sent, release = asyncio.Event(), asyncio.Event()
+        gets = 0
+
+        async def handler(request: httpx.Request) -> Response:
+            nonlocal gets
+            if request.method == "PUT":
+                return _json_response(200, _memory(content="new"))
+            gets += 1
+            if gets == 1:
+                sent.set()
+                await release.wait()
+                return _json_response(200, _memory(content="old"))
+            return _json_response(200, _memory(content="new"))
+
+        async with AsyncMAIAClient(
+            base_url=BASE_URL, cache_size=16, transport=httpx.MockTransport(handler)
+        ) as client:
+            before = asyncio.ensure_future(client.get_memory("mem-123"))
+            await sent.wait()
+            await client.update_memory("mem-123", UpdateMemoryInput(content="new"))
+            release.set()
+            assert (await before).content == "old"
+
+            memory = await client.get_memory("mem-123")
+
+        assert memory.content == "new"
+        assert gets == 2
+
+    async def test_get_memory_single_flight_after_write(self) -> None:
+        """Test that a GET issued after a write doesn't join an older one."""
+        sent, release = asyncio.Event(), asyncio.Event()
+        gets = 0
+
+        async def handler(request: httpx.Request) -> Response:
+            nonlocal gets
+            if request.method == "PUT":
+                return _json_response(200, _memory(content="new"))
+            gets += 1
+            if gets == 1:
+                sent.set()
+                await release.wait()
+                return _json_response(200, _memory(content="old"))
+            return _json_response(200, _memory(content="new"))
+
+        async with AsyncMAIAClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(handler)
+        ) as client:
+            before = asyncio.ensure_future(client.get_memory("mem-123"))
+            await sent.wait()
+            await client.update_memory("mem-123", UpdateMemoryInput(content="new"))
+            after = asyncio.ensure_future(client.get_memory("mem-123"))
+            await asyncio.sleep(0)
+            release.set()
+
+            assert (await before).content == "old"
+            assert (await after).content == "new"
+            assert not client._inflight
+
+        assert gets == 2
+
+    async def test_context_manager(self, respx_mock: respx.MockRouter) -> None:
+        """Test using the async client as a context manager."""
+        async with AsyncMAIAClient(base_url=BASE_URL) as client:
+            response = await client.health()
+
+        assert response.status == "healthy"
+        assert client._client.is_closed
+
+    async def test_default_async_client(self) -> None:
+        """Test sharing a process-wide async client."""
+        client = get_default_async_client(BASE_URL, headers={"X-Test": "1"})
+
+        assert get_default_async_client(BASE_URL, headers={"X-Test": "1"}) is client
+        assert get_default_async_client(BASE_URL, headers={"X-Test": "2"}) is not client
+
+        await client.close()
+        assert get_default_async_client(BASE_URL, headers={"X-Test": "1"}) is not client
+
+
+class TestDefaultAsyncClient:
+    """Tests for the process-wide async clients across event loops."""
+
+    def test_one_client_per_loop(self, respx_mock: respx.MockRouter) -> None:
+        """Test that each asyncio.run() gets its own client, closed on exit."""
+
+        async def use() -> AsyncMAIAClient:
+            client = get_default_async_client(BASE_URL, headers={"X-Loop": "1"})
+            assert get_default_async_client(BASE_URL, headers={"X-Loop": "1"}) is client
+            await client.health()
+            return client
+
+        first = asyncio.run(use())
+        second = asyncio.run(use())
+
+        assert second is not first
+        assert first._client.is_closed
+        assert second._client.is_closed
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestClients:
+    """Tests shared by the synchronous and asynchronous clients."""
+
+    async def test_health(
+        self, any_client: MAIAClient | AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test health check."""
+        response = await _maybe_await(any_client.health())
+
+        assert response.status == "healthy"
+        assert response.service == "maia"
+
+    async def test_create_memory(
+        self, any_client: MAIAClient | AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test creating a memory."""
+        memory = await _maybe_await(any_client.create_memory(_mk_create()))
+
+        assert memory.id == "mem-123"
+        assert memory.content == "Test memory"
+
+    async def test_remember(
+        self, any_client: MAIAClient | AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test remember convenience method."""
+        route = respx_mock.post(_URL_MEMORIES).mock(
+            return_value=_json_response(201, _memory(content="User likes coffee"))
+        )
+
+        memory = await _maybe_await(any_client.remember("test", "User likes coffee"))
+
+        assert memory.id == "mem-123"
+        assert memory.content == "User likes coffee"
+        assert json.loads(route.calls[0].request.content) == {
+            "namespace": "test",
+            "content": "User likes coffee",
+            "type": "semantic",
+            "source": "user",
+            "confidence": 1.0,
+        }
+
+    async def test_recall(
+        self, any_client: MAIAClient | AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test recall convenience method."""
+        response = await _maybe_await(
+            any_client.recall("user preferences", namespace="test", token_budget=1000)
+        )
+
+        assert response.content == "User likes coffee"
+
+    async def test_get_memories_batch(
+        self, any_client: MAIAClient | AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test getting several memories through the batch endpoint."""
+        respx_mock.get(_URL_HEALTH).mock(return_value=_health("batch"))
+        route = respx_mock.post(_URL_BATCH).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "results": [
+                        {"status": 200, "body": _memory()},
+                        {"status": 200, "body": _memory(id="mem-456")},
+                    ]
+                },
+            )
+        )
+
+        memories = await _maybe_await(any_client.get_memories(["mem-123", "mem-456"]))
+
+        assert [m.id for m in memories] == ["mem-123", "mem-456"]
+        assert memories[0].type == MemoryType.SEMANTIC
+        assert json.loads(route.calls[0].request.content) == {
+            "calls": [
+                {"method": "GET", "path": "/v1/memories/mem-123", "input_from": -1},
+                {"method": "GET", "path": "/v1/memories/mem-456", "input_from": -1},
+            ]
+        }
+
+    async def test_get_memories_fallback(
+        self, any_client: MAIAClient | AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test getting several memories when batching is unsupported."""
+        respx_mock.get(_URL_MEMORY).mock(return_value=_resp(_MEMORY_BYTES))
+
+        memories = await _maybe_await(any_client.get_memories(["mem-123"]))
+
+        assert [m.id for m in memories] == ["mem-123"]
+
+    async def test_remember_many_batch(
+        self, any_client: MAIAClient | AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test storing several memories through the batch endpoint."""
+        respx_mock.get(_URL_HEALTH).mock(return_value=_health("batch"))
+        route = respx_mock.post(_URL_BATCH).mock(
+            return_value=_json_response(
+                200,
+                {
+                    "results": [
+                        {"status": 201, "body": _memory(id="mem-1", content="a")},
+                        {"status": 201, "body": _memory(id="mem-2", content="b")},
+                    ]
+                },
+            )
+        )
+
+        memories = await _maybe_await(any_client.remember_many("test", ["a", "b"]))
+
+        assert [(m.id, m.content) for m in memories] == [("mem-1", "a"), ("mem-2", "b")]
+        assert json.loads(route.calls[0].request.content) == {
+            "calls": [
+                {
+                    "method": "POST",
+                    "path": "/v1/memories",
+                    "json": {
+                        "type": "semantic",
+                        "source": "user",
+                        "confidence": 1.0,
+                        "namespace": "test",
+                        "content": content,
+                    },
+                    "input_from": -1,
+                }
+                for content in ("a", "b")
+            ]
+        }
+
+    async def test_remember_many_fallback(
+        self, any_client: MAIAClient | AsyncMAIAClient, respx_mock: respx.MockRouter
+    ) -> None:
+        """Test storing several memories when batching is unsupported."""
+        route = respx_mock["create_memory"]
+
+        memories = await _maybe_await(any_client.remember_many("test", ["a", "b"]))
+
+        assert [m.id for m in memories] == ["mem-123", "mem-123"]
+        assert [json.loads(c.request.content)["content"] for c in route.calls] == [
+            "a",
+            "b",
+        ]
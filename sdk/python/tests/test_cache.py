@@ -0,0 +1,75 @@
+"""Tests for the MAIA SDK response cache."""
+
+import time
+
+import pytest
+
+from maia._cache import ResponseCache
+
+pytestmark = pytest.mark.fast
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_get_set(self) -> None:
+        """Test storing and reading a response body."""
+        cache = ResponseCache(maxsize=2, ttl=60)
+        key = cache.key("/v1/namespaces", {"offset": 10, "limit": 5})
+
+        assert cache.get(key) is None
+        cache.set(key, b"{}")
+        assert cache.get(key) == b"{}"
+        assert (
+            cache.get(cache.key("/v1/namespaces", {"limit": 5, "offset": 10})) == b"{}"
+        )
+
+    def test_expiry(self) -> None:
+        """Test that entries expire after the TTL."""
+        cache = ResponseCache(maxsize=2, ttl=0.01)
+        key = cache.key("/health", None)
+        cache.set(key, b"{}")
+
+        time.sleep(0.02)
+        assert cache.get(key) is None
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = ResponseCache(maxsize=2, ttl=60)
+        a, b, c = (cache.key(p, None) for p in ("/a", "/b", "/c"))
+        cache.set(a, b"a")
+        cache.set(b, b"b")
+        cache.get(a)
+        cache.set(c, b"c")
+
+        assert cache.get(a) == b"a"
+        assert cache.get(b) is None
+        assert cache.get(c) == b"c"
+
+    def test_invalidate(self) -> None:
+        """Test dropping entries by path prefix."""
+        cache = ResponseCache(maxsize=4, ttl=60)
+        memory = cache.key("/v1/memories/mem-1", None)
+        listing = cache.key("/v1/namespaces/test/memories", None)
+        stats = cache.key("/v1/stats", None)
+        for key in (memory, listing, stats):
+            cache.set(key, b"{}")
+
+        cache.invalidate("/v1/memories/mem-1", "/v1/namespaces/test")
+
+        assert cache.get(memory) is None
+        assert cache.get(listing) is None
+        assert cache.get(stats) == b"{}"
+
+    def test_set_after_invalidate(self) -> None:
+        """Test that a body read before an invalidation is not stored."""
+        cache = ResponseCache(maxsize=2, ttl=60)
+        key = cache.key("/v1/memories/mem-1", None)
+        generation = cache.generation
+
+        cache.invalidate("/v1/memories/mem-1")
+        cache.set(key, b"stale", generation)
+        assert cache.get(key) is None
+
+        cache.set(key, b"fresh", cache.generation)
+        assert cache.get(key) == b"fresh"
@@ -11,6 +11,8 @@ from maia.errors import (
     AlreadyExistsError,
 )
 
+pytestmark = pytest.mark.fast
+
 
 class TestMAIAError:
     """Tests for MAIAError."""
@@ -38,40 +40,55 @@ class TestAPIError:
         assert error.code == "NOT_FOUND"
         assert error.details == "memory not found"
 
-    def test_str_with_code(self) -> None:
-        """Test string representation with code."""
-        error = APIError(404, "not found", "NOT_FOUND")
-        assert str(error) == "not found (NOT_FOUND)"
-
-    def test_str_without_code(self) -> None:
-        """Test string representation without code."""
-        error = APIError(500, "internal error")
-        assert str(error) == "internal error"
-
-    def test_is_not_found(self) -> None:
-        """Test is_not_found method."""
-        error = APIError(404, "not found", "NOT_FOUND")
-        assert error.is_not_found() is True
-        assert error.is_already_exists() is False
-
-    def test_is_already_exists(self) -> None:
-        """Test is_already_exists method."""
-        error = APIError(409, "exists", "ALREADY_EXISTS")
-        assert error.is_already_exists() is True
-        assert error.is_not_found() is False
-
-    def test_is_invalid_input(self) -> None:
-        """Test is_invalid_input method."""
-        error = APIError(400, "invalid", "INVALID_INPUT")
-        assert error.is_invalid_input() is True
-
-    def test_is_server_error(self) -> None:
-        """Test is_server_error method."""
-        error = APIError(500, "internal error")
-        assert error.is_server_error() is True
-
-        error = APIError(404, "not found")
-        assert error.is_server_error() is False
+    @pytest.mark.parametrize(
+        "status,message,code,expected_str,"
+        "is_not_found,is_already_exists,is_invalid_input,is_server_error",
+        [
+            pytest.param(
+                404, "not found", "NOT_FOUND", "not found (NOT_FOUND)",
+                True, False, False, False,
+                id="404-not_found",
+            ),
+            pytest.param(
+                404, "not found", None, "not found",
+                True, False, False, False,
+                id="404-without_code",
+            ),
+            pytest.param(
+                409, "exists", "ALREADY_EXISTS", "exists (ALREADY_EXISTS)",
+                False, True, False, False,
+                id="409-already_exists",
+            ),
+            pytest.param(
+                400, "invalid", "INVALID_INPUT", "invalid (INVALID_INPUT)",
+                False, False, True, False,
+                id="400-invalid_input",
+            ),
+            pytest.param(
+                500, "internal error", None, "internal error",
+                False, False, False, True,
+                id="500-server_error",
+            ),
+        ],
+    )  # fmt: skip
+    def test_api_error(
+        self,
+        status: int,
+        message: str,
+        code: str | None,
+        expected_str: str,
+        is_not_found: bool,
+        is_already_exists: bool,
+        is_invalid_input: bool,
+        is_server_error: bool,
+    ) -> None:
+        """Test string representation and status predicates."""
+        error = APIError(status, message, code)
+        assert str(error) == expected_str
+        assert error.is_not_found() is is_not_found
+        assert error.is_already_exists() is is_already_exists
+        assert error.is_invalid_input() is is_invalid_input
+        assert error.is_server_error() is is_server_error
 
 
 class TestValidationError:
@@ -104,21 +121,63 @@ class TestNetworkError:
 class TestNotFoundError:
     """Tests for NotFoundError."""
 
-    def test_create_error(self) -> None:
-        """Test creating a NotFoundError."""
-        error = NotFoundError("memory", "123")
-        assert error.resource == "memory"
-        assert error.id == "123"
-        assert error.is_not_found() is True
-        assert str(error) == "memory not found: 123 (NOT_FOUND)"
-
-
-class TestAlreadyExistsError:
-    """Tests for AlreadyExistsError."""
-
-    def test_create_error(self) -> None:
-        """Test creating an AlreadyExistsError."""
-        error = AlreadyExistsError("namespace", "test")
-        assert error.resource == "namespace"
-        assert error.id == "test"
-        assert error.is_already_exists() is True
+    def test_create_error_from_response(self) -> None:
+        """Test creating a NotFoundError from a server response."""
+        error = NotFoundError(message="memory not found", details="id: 123")
+        assert error.status_code == 404
+        assert error.resource is None
+        assert error.details == "id: 123"
+        assert str(error) == "memory not found (NOT_FOUND)"
+
+
+class TestResourceErrors:
+    """Tests for NotFoundError and AlreadyExistsError."""
+
+    @pytest.mark.parametrize(
+        "cls,resource,id_,predicate,expected_str",
+        [
+            pytest.param(
+                NotFoundError, "memory", "123", "is_not_found",
+                "memory not found: 123 (NOT_FOUND)",
+                id="not_found",
+            ),
+            pytest.param(
+                AlreadyExistsError, "namespace", "test", "is_already_exists",
+                None,
+                id="already_exists",
+            ),
+        ],
+    )  # fmt: skip
+    def test_create_error(
+        self,
+        cls: type[NotFoundError | AlreadyExistsError],
+        resource: str,
+        id_: str,
+        predicate: str,
+        expected_str: str | None,
+    ) -> None:
+        """Test creating a resource error."""
+        error = cls(resource, id_)
+        assert error.resource == resource
+        assert error.id == id_
+        assert getattr(error, predicate)() is True
+        if expected_str is not None:
+            assert str(error) == expected_str
+
+    @pytest.mark.parametrize(
+        "cls,expected_str",
+        [
+            pytest.param(NotFoundError, "not found (NOT_FOUND)", id="not_found"),
+            pytest.param(
+                AlreadyExistsError, "already exists (ALREADY_EXISTS)",
+                id="already_exists",
+            ),
+        ],
+    )  # fmt: skip
+    def test_create_error_without_resource(
+        self, cls: type[NotFoundError | AlreadyExistsError], expected_str: str
+    ) -> None:
+        """Test the message of a resource error built without a resource."""
+        error = cls(message="")
+        assert error.resource is None
+        assert str(error) == expected_str